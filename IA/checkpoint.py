@@ -0,0 +1,161 @@
+# checkpoint.py
+# Checkpoints para corridas largas con TimeLimit (usado por gemini_model.py)
+# Guarda: incumbente, mejor cota, tiempo transcurrido y metadatos
+# Permite retomar (--resume) desde el modelo cacheado + incumbente
+# Todo se guarda por posición en model.getVars(), no por nombre: los IDs con espacios
+# ("La Serena") hacen que Gurobi escriba el .mps con nombres por defecto (C0, C1, ...)
+
+import json
+import os
+import time
+from itertools import product
+
+MODEL_FILE = "model.mps"        # cache del modelo construido
+VARS_FILE  = "variables.json"   # familia -> [primer índice, nº de variables] en getVars()
+SOL_FILE   = "incumbent.json"   # última solución incumbente (valores en orden de getVars())
+META_FILE  = "checkpoint.json"  # cota, tiempo, metadatos
+
+
+def _write_atomic(path, text):
+    # escribir a tmp y renombrar: un crash a mitad no deja archivos corruptos
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp, path)
+
+
+def load_meta(directory):
+    path = os.path.join(directory, META_FILE)
+    if not os.path.exists(path):
+        return None
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_model(model, directory, families):
+    # families: {nombre: tupledict de addVars}; cada addVars ocupa índices consecutivos
+    os.makedirs(directory, exist_ok=True)
+    model.update()
+    rangos = {}
+    for name, td in families.items():
+        idx = sorted(var.index for var in td.values())
+        if idx and idx[-1] - idx[0] + 1 != len(idx):
+            raise ValueError(f"Las variables '{name}' no son contiguas en el modelo")
+        rangos[name] = [idx[0] if idx else 0, len(idx)]
+    model.write(os.path.join(directory, MODEL_FILE))
+    _write_atomic(os.path.join(directory, VARS_FILE), json.dumps(rangos, indent=2))
+
+
+def clear(directory):
+    # corrida nueva: borrar incumbente y metadatos de la corrida anterior
+    # (si no, un --resume posterior usaría su tiempo y su MIP start)
+    for fname in (SOL_FILE, META_FILE):
+        path = os.path.join(directory, fname)
+        if os.path.exists(path):
+            os.remove(path)
+
+
+def load_model(directory):
+    # devuelve None si no hay modelo cacheado (hay que construirlo)
+    path = os.path.join(directory, MODEL_FILE)
+    if not os.path.exists(path) or not os.path.exists(os.path.join(directory, VARS_FILE)):
+        return None
+    import gurobipy as gp
+    return gp.read(path)
+
+
+def recover_vars(model, directory, name, *sets):
+    # reconstruye el tupledict de addVars(..., name=name) por posición: addVars recorre
+    # el producto de los conjuntos en orden (pueden ser de tuplas, p.ej. pares (i,p))
+    with open(os.path.join(directory, VARS_FILE), encoding="utf-8") as f:
+        rangos = json.load(f)
+    if name not in rangos:
+        raise KeyError(f"La variable '{name}' no está en el checkpoint {directory}")
+    start, count = rangos[name]
+    keys = [tuple(x for part in combo for x in (part if isinstance(part, tuple) else (part,)))
+            for combo in product(*sets)]
+    if len(keys) != count:
+        raise ValueError(f"'{name}' tiene {count} variables en el checkpoint y {len(keys)} "
+                         f"con los datos actuales")
+    import gurobipy as gp
+    variables = model.getVars()
+    return gp.tupledict(zip(keys, variables[start:start + count]))
+
+
+def seed_incumbent(model, directory):
+    # carga el incumbente guardado como MIP start (Start por índice); False si no existe
+    path = os.path.join(directory, SOL_FILE)
+    if not os.path.exists(path):
+        return False
+    with open(path, encoding="utf-8") as f:
+        values = json.load(f)["x"]
+    model.update()
+    variables = model.getVars()
+    if len(values) != len(variables):
+        raise ValueError(f"El incumbente tiene {len(values)} valores y el modelo {len(variables)} variables")
+    model.setAttr("Start", variables, values)
+    return True
+
+
+class Checkpointer:
+    """Callback de Gurobi que escribe checkpoints en cada nuevo incumbente
+    y cada `interval` segundos."""
+
+    def __init__(self, model, directory, interval=300.0, elapsed_prev=0.0, metadata=None):
+        os.makedirs(directory, exist_ok=True)
+        self.directory = directory
+        self.interval = interval
+        self.elapsed_prev = elapsed_prev
+        self.metadata = dict(metadata or {})
+        self.vars = model.getVars()
+        self.sense = model.ModelSense   # 1 = minimizar, -1 = maximizar
+        self.best_obj = None
+        self.best_bound = None
+        # metadatos iniciales: un crash antes del primer incumbente deja el tiempo correcto
+        self._write_meta(0.0, "started")
+
+    def _improves(self, obj):
+        return self.best_obj is None or self.sense * (obj - self.best_obj) < 0
+
+    def __call__(self, model, where):
+        from gurobipy import GRB
+
+        if where == GRB.Callback.MIPSOL:
+            # MIPSOL también reporta soluciones que no mejoran al incumbente
+            obj = model.cbGet(GRB.Callback.MIPSOL_OBJ)
+            if not self._improves(obj):
+                return
+            self.best_obj = obj
+            self.best_bound = model.cbGet(GRB.Callback.MIPSOL_OBJBND)
+            self._write_sol(model.cbGetSolution(self.vars))
+            self._write_meta(model.cbGet(GRB.Callback.RUNTIME), "running")
+        elif where == GRB.Callback.MIP and time.time() - self._last >= self.interval:
+            self.best_obj = model.cbGet(GRB.Callback.MIP_OBJBST)
+            self.best_bound = model.cbGet(GRB.Callback.MIP_OBJBND)
+            self._write_meta(model.cbGet(GRB.Callback.RUNTIME), "running")
+
+    def finish(self, model):
+        # checkpoint final tras optimize() (status y tiempo definitivos)
+        if model.SolCount > 0:
+            self.best_obj = model.ObjVal
+            self._write_sol(model.getAttr("X", self.vars))
+        if model.IsMIP:
+            self.best_bound = model.ObjBound
+        self._write_meta(model.Runtime, model.Status)
+
+    def _write_sol(self, values):
+        # por posición en getVars(): no depende de los nombres de variables
+        _write_atomic(os.path.join(self.directory, SOL_FILE),
+                      json.dumps({"obj": self.best_obj, "x": list(values)}))
+
+    def _write_meta(self, runtime, status):
+        meta = dict(self.metadata)
+        meta.update({
+            "status": status,
+            "elapsed": self.elapsed_prev + runtime,
+            "best_obj": self.best_obj,
+            "best_bound": self.best_bound,
+            "written_at": time.strftime("%Y-%m-%d %H:%M:%S"),
+        })
+        _write_atomic(os.path.join(self.directory, META_FILE), json.dumps(meta, indent=2))
+        self._last = time.time()
@@ -0,0 +1,275 @@
+# decomposition.py
+# Descomposición por corredores con resolución paralela (usado por gpt_model.py)
+# - Grafo ruta–nodo desde A_ip; dos rutas quedan en la misma región si comparten
+#   un nodo que NO es de unión (junction). Los nodos de unión pueden estar en varias regiones.
+# - Cada nodo de unión tiene una región dueña (paga su costo y decide s, x); en las demás
+#   regiones sus decisiones quedan fijas en el valor del dueño de la iteración anterior,
+#   así las decisiones en nodos compartidos son siempre consistentes.
+# - Si una región es infactible con esos valores fijos, se re-resuelve liberándolos y lo
+#   que necesitó de cada nodo de unión pasa como cota inferior (`floor`) a su dueño.
+# - Un maestro reparte B_t / B_INC_t entre regiones: lo usado + el saldo según el precio
+#   sombra del presupuesto (LP con enteros fijos), con amortiguación, hasta converger.
+# Heurística: la unión de las soluciones regionales (s, x) se evalúa en el modelo nacional
+# con s, x fijos (re-resolviendo z, v); ese es el objetivo reportado, no la suma de los
+# regionales (que con regiones liberadas cuenta dos veces costos de nodos de unión).
+# El resultado es factible pero no necesariamente óptimo.
+
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+
+
+# -------------------------
+# 1) Regiones desde A_ip
+# -------------------------
+def find_regions(N, P, A_ip, junctions):
+    """Componentes de rutas unidas por nodos no-junction.
+
+    Devuelve (regiones, dueños): cada región es {"routes": [...], "nodes": [...]}
+    y dueños[j] = índice de la región que controla el nodo de unión j.
+    """
+    es_union = set(junctions)
+    nodos_ruta = {p: [i for i in N if A_ip.get((i, p), 0) > 0] for p in P}
+
+    # union-find sobre rutas
+    padre = {p: p for p in P}
+
+    def raiz(p):
+        while padre[p] != p:
+            padre[p] = padre[padre[p]]
+            p = padre[p]
+        return p
+
+    rutas_nodo = defaultdict(list)
+    for p in P:
+        for i in nodos_ruta[p]:
+            rutas_nodo[i].append(p)
+    for i, rutas in rutas_nodo.items():
+        if i in es_union:
+            continue
+        for p in rutas[1:]:
+            padre[raiz(p)] = raiz(rutas[0])
+
+    comp = defaultdict(list)
+    for p in P:
+        comp[raiz(p)].append(p)
+
+    regiones = []
+    for rutas in comp.values():
+        nodos = [i for i in N if any(i in nodos_ruta[p] for p in rutas)]
+        regiones.append({"routes": rutas, "nodes": nodos})
+
+    # dueño: región con más rutas del nodo (empate: la primera)
+    duenos = {}
+    for j in junctions:
+        cuenta = [sum(1 for p in r["routes"] if p in rutas_nodo[j]) for r in regiones]
+        if max(cuenta, default=0) > 0:
+            duenos[j] = cuenta.index(max(cuenta))
+    return regiones, duenos
+
+
+# -------------------------
+# 2) Reparto de presupuestos
+# -------------------------
+def split_budget(total, pesos):
+    # total[t] repartido proporcional a pesos[r][t] (uniforme si todos son 0)
+    n = len(pesos)
+    alloc = []
+    for r in range(n):
+        alloc.append({})
+        for t, B in total.items():
+            suma = sum(pesos[q][t] for q in range(n))
+            alloc[r][t] = B * (pesos[r][t] / suma if suma > 0 else 1.0 / n)
+    return alloc
+
+
+def rebalance(total, alloc, usado, precio, damping=0.5):
+    """Nuevo reparto: cada región conserva lo usado y el saldo se reparte según
+    el precio sombra del presupuesto. Devuelve (reparto, cambio relativo máximo)."""
+    n = len(alloc)
+    nuevo = split_budget({t: total[t] - sum(usado[r][t] for r in range(n)) for t in total}, precio)
+    cambio = 0.0
+    for r in range(n):
+        for t in total:
+            objetivo = usado[r][t] + nuevo[r][t]
+            valor = (1 - damping) * alloc[r][t] + damping * objetivo
+            cambio = max(cambio, abs(valor - alloc[r][t]) / max(total[t], 1.0))
+            nuevo[r][t] = valor
+    return nuevo, cambio
+
+
+# -------------------------
+# 3) Subproblema regional (se ejecuta en un proceso del pool)
+# -------------------------
+def _solve_region(task):
+    from gurobipy import GRB
+
+    builder, params, kwargs, threads = task
+    m, s, x, v, z = builder(*params, **kwargs)
+    m.Params.OutputFlag = 0
+    m.Params.Threads = threads
+    m.optimize()
+    if m.SolCount == 0:
+        return {"status": m.Status}
+
+    res = {"status": m.Status, "obj": m.ObjVal,
+           "s": {key: var.X for key, var in s.items()},
+           "x": {key: var.X for key, var in x.items()},
+           "z": {key: var.X for key, var in z.items()},
+           "used": {}, "used_inc": {}, "pi": {}, "pi_inc": {}}
+    filas = {t: (m.getConstrByName(f"budget_inv_opex[{t}]"),
+                 m.getConstrByName(f"budget_incentivos[{t}]")) for t in kwargs["budget"]}
+    for t, (c, c_inc) in filas.items():
+        res["used"][t] = m.getRow(c).getValue()
+        res["used_inc"][t] = m.getRow(c_inc).getValue()
+
+    # precios sombra: LP con las variables enteras fijas en la solución
+    f = m.fixed()
+    f.Params.OutputFlag = 0
+    f.optimize()
+    for t in filas:
+        ok = f.Status == GRB.OPTIMAL
+        res["pi"][t] = abs(f.getConstrByName(f"budget_inv_opex[{t}]").Pi) if ok else 0.0
+        res["pi_inc"][t] = abs(f.getConstrByName(f"budget_incentivos[{t}]").Pi) if ok else 0.0
+    return res
+
+
+def evaluate(builder, node_params, s_val, x_val):
+    """Fija s, x en el modelo nacional y re-resuelve el resto (z, v).
+
+    Devuelve (objetivo, z) o None si la solución ensamblada es infactible."""
+    m, s, x, v, z = builder(*node_params)
+    m.Params.OutputFlag = 0
+    for key, var in s.items():
+        var.LB = var.UB = round(s_val[key])
+    for key, var in x.items():
+        var.LB = var.UB = round(x_val[key])
+    m.optimize()
+    if m.SolCount == 0:
+        return None
+    return m.ObjVal, {key: var.X for key, var in z.items()}
+
+
+# -------------------------
+# 4) Maestro
+# -------------------------
+def solve_decomposed(builder, node_params, P, T, K, B_t, B_INC_t, peso_ruta, junctions,
+                     workers=None, max_iter=20, tol=1e-3, damping=0.5):
+    """Resuelve por regiones en paralelo coordinando presupuestos y nodos de unión.
+
+    `builder(N, A_ip, ..., routes=, budget=, budget_inc=, fixed=, floor=)` es build_model de
+    gpt_model.py; `node_params` sus argumentos por nodo. Devuelve un dict con el
+    objetivo nacional de la solución ensamblada (ver `evaluate`), valores s/x/z, reparto
+    final e historial de iteraciones; None si la solución ensamblada es infactible.
+    """
+    N, A_ip = node_params[0], node_params[1]
+    regiones, duenos = find_regions(N, P, A_ip, junctions)
+    n = len(regiones)
+    workers = workers or min(n, os.cpu_count() or 1)
+    threads = max(1, (os.cpu_count() or 1) // workers)
+
+    pesos = [{t: sum(peso_ruta[(p, t)] for p in r["routes"]) for t in T} for r in regiones]
+    alloc, alloc_inc = split_budget(B_t, pesos), split_budget(B_INC_t, pesos)
+
+    print(f"Descomposición: {n} regiones, {len(duenos)} nodos de unión, {workers} procesos")
+    for r, reg in enumerate(regiones):
+        print(f"  región {r}: {len(reg['routes'])} rutas, {len(reg['nodes'])} nodos ({', '.join(reg['routes'])})")
+
+    fijos_prev = {}
+    piso = {}   # cotas inferiores para los dueños, pedidas por regiones que liberaron uniones
+    historial = []
+    convergio = False
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for it in range(1, max_iter + 1):
+            t0 = time.time()
+            tareas = []
+            for r, reg in enumerate(regiones):
+                # nodos de unión ajenos: fijos en el valor del dueño (iteración anterior)
+                fixed = {j: fijos_prev[j] for j in reg["nodes"]
+                         if j in duenos and duenos[j] != r and j in fijos_prev}
+                floor = {j: piso[j] for j in reg["nodes"] if duenos.get(j) == r and j in piso}
+                kwargs = {"routes": reg["routes"], "budget": alloc[r],
+                          "budget_inc": alloc_inc[r], "fixed": fixed, "floor": floor}
+                params = (reg["nodes"],) + tuple(node_params[1:])
+                tareas.append((builder, params, kwargs, threads))
+            res = list(pool.map(_solve_region, tareas))
+
+            # infactibles con uniones fijas (o pisos): se re-resuelven liberándolas
+            liberadas = [r for r, sol in enumerate(res) if "obj" not in sol
+                         and (tareas[r][2]["fixed"] or tareas[r][2]["floor"])]
+            if liberadas:
+                print(f"  iter {it}: regiones {liberadas} infactibles con uniones fijas; se liberan")
+                reintentos = [(builder, tareas[r][1], {**tareas[r][2], "fixed": {}, "floor": {}}, threads)
+                              for r in liberadas]
+                for r, sol in zip(liberadas, pool.map(_solve_region, reintentos)):
+                    res[r] = sol
+            fallidas = [r for r, sol in enumerate(res) if "obj" not in sol]
+            if fallidas:
+                print(f"  iter {it}: regiones sin solución {fallidas} "
+                      f"(status {[res[r]['status'] for r in fallidas]})")
+                return None
+
+            # lo que cada región liberada usó en uniones ajenas: piso para el dueño
+            for r in liberadas:
+                for j in tareas[r][2]["fixed"]:
+                    prev = piso.get(j, {"s": {t: 0.0 for t in T}, "x": {(k, t): 0.0 for k in K for t in T}})
+                    piso[j] = {"s": {t: max(prev["s"][t], round(res[r]["s"][j, t])) for t in T},
+                               "x": {(k, t): max(prev["x"][k, t], round(res[r]["x"][j, k, t]))
+                                     for k in K for t in T}}
+
+            fijos = {j: {"s": {t: res[r]["s"][j, t] for t in T},
+                         "x": {(k, t): res[r]["x"][j, k, t] for k in K for t in T}}
+                     for j, r in duenos.items()}
+            if not duenos:
+                cambio_nodos = 0.0
+            elif not fijos_prev:
+                cambio_nodos = float("inf")
+            else:
+                cambio_nodos = max(abs(fijos[j][var][key] - fijos_prev[j][var][key])
+                                   for j in fijos for var in ("s", "x") for key in fijos[j][var])
+            usado_B, usado_inc = alloc, alloc_inc   # reparto con que se resolvió esta iteración
+            alloc, cambio = rebalance(B_t, alloc, [sol["used"] for sol in res],
+                                      [sol["pi"] for sol in res], damping)
+            alloc_inc, cambio_inc = rebalance(B_INC_t, alloc_inc, [sol["used_inc"] for sol in res],
+                                              [sol["pi_inc"] for sol in res], damping)
+            obj = sum(sol["obj"] for sol in res)
+            historial.append({"iter": it, "obj": obj, "cambio_B": max(cambio, cambio_inc),
+                              "cambio_nodos": cambio_nodos, "tiempo": time.time() - t0})
+            print(f"  iter {it}: obj={obj:,.0f} ΔB={max(cambio, cambio_inc):.2e} "
+                  f"Δunión={cambio_nodos:.1f} ({time.time() - t0:.1f}s)")
+            fijos_prev = fijos
+            convergio = max(cambio, cambio_inc) < tol and cambio_nodos < 0.5 and not liberadas
+            if convergio:
+                break
+    if not convergio:
+        print(f"  sin convergencia en {max_iter} iteraciones: nodos de unión pueden diferir")
+
+    # solución nacional: nodos de unión desde su dueño, el resto desde su (única) región
+    s_val, x_val = {}, {}
+    for r, (reg, sol) in enumerate(zip(regiones, res)):
+        for i in reg["nodes"]:
+            if i in duenos and duenos[i] != r:
+                continue
+            for t in T:
+                s_val[i, t] = sol["s"][i, t]
+                for k in K:
+                    x_val[i, k, t] = sol["x"][i, k, t]
+    for i in N:  # nodos fuera de toda ruta: no se abren
+        for t in T:
+            s_val.setdefault((i, t), 0.0)
+            for k in K:
+                x_val.setdefault((i, k, t), 0.0)
+
+    # objetivo y z reales: las z regionales se calcularon con otros valores de unión
+    # si no convergió, y la suma regional puede duplicar costos de regiones liberadas
+    evaluada = evaluate(builder, node_params, s_val, x_val)
+    if evaluada is None:
+        print("  la solución ensamblada es infactible en el modelo nacional")
+        return None
+    obj, z_val = evaluada
+    print(f"  objetivo nacional (s, x fijos): {obj:,.0f} (suma regional {historial[-1]['obj']:,.0f})")
+
+    return {"obj": obj, "heuristic": True, "s": s_val, "x": x_val, "z": z_val, "regions": regiones,
+            "owners": duenos, "budget": usado_B, "budget_inc": usado_inc,
+            "converged": convergio, "history": historial}
@@ -1,19 +1,43 @@
 # main.py
 # Entrypoint obligatorio para la Entrega 3
-# Requisitos: pandas, numpy, gurobipy
+# Requisitos: pandas, gurobipy (se importan al cargar datos / construir)
 # Ejecutar: python main.py
+# Corridas largas: python IA/gemini_model.py --checkpoint-dir CHECKPOINT/ [--resume]
+# Importable sin efectos: load_data/build_params/build_model/solve; se ejecuta con main()
 
-import pandas as pd
-import numpy as np
-import gurobipy as gp
-from gurobipy import GRB
+import argparse
+import os
+import sys
 from collections import defaultdict
 
+import checkpoint
+
 # -------------------------
 # 0) CONFIG / Rutas datos
 # -------------------------
 DATA_DIR = "DATA/"
 OUT_DIR  = "OUTPUT/"
+TIME_LIMIT = 1800   # 30 minutos exigidos por la pauta (presupuesto total, incluye reanudaciones)
+
+parser = argparse.ArgumentParser(description="Modelo EV Planning E3")
+parser.add_argument("--checkpoint-dir", default="CHECKPOINT/",
+                    help="directorio de checkpoints (modelo, incumbente, metadatos)")
+parser.add_argument("--checkpoint-interval", type=float, default=300.0,
+                    help="segundos entre checkpoints periódicos")
+parser.add_argument("--resume", action="store_true",
+                    help="retomar desde el último checkpoint con el tiempo restante")
+parser.add_argument("--nodefile-start", type=float, default=None,
+                    help="GB de árbol B&B en memoria antes de escribir nodos a disco")
+parser.add_argument("--nodefile-dir", default=None,
+                    help="directorio para los node files (por defecto el de trabajo)")
+parser.add_argument("--dry-run", action="store_true",
+                    help="sólo estimar variables, filas, nonzeros y memoria (no construye)")
+parser.add_argument("--mem-budget", type=float, default=None,
+                    help="GB máximos estimados; si se exceden no se construye el modelo")
+parser.add_argument("--sparse", action="store_true",
+                    help="crear a[i,p,t] sólo para pares elegibles A_ip = 1")
+parser.add_argument("--horizon", type=int, default=None,
+                    help="usar sólo los primeros H años de D_p_t")
 
 # CSV esperados (ver instrucciones en el README de datos)
 FILES = {
@@ -41,6 +65,8 @@ FILES = {
 # 1) CARGA DATOS
 # -------------------------
 def load_data():
+    import pandas as pd
+
     # simple wrappers that give helpful errors if file missing
     def r(fname):
         try:
@@ -76,194 +102,276 @@ def load_data():
         "omega": omega_df
     }
 
-data = load_data()
+# dry-run / presupuesto de memoria: sólo tamaños de los CSV, antes de cargar todo
+def estimate(args):
+    sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+    import estimator
+
+    sizes = estimator.read_sizes(DATA_DIR)
+    families = estimator.estimate_gemini(sizes, args.sparse, args.horizon)
+    estimator.report(sizes, families, "gemini_model")
+    suggestions = estimator.suggest_gemini(sizes, args.mem_budget * 1e9) if args.mem_budget else []
+    estimator.check_budget(sizes, families, args.mem_budget, suggestions)
 
 # -------------------------
 # 2) Construcción conjuntos y parámetros (dicts)
 # -------------------------
-N = data["nodes"]["node_id"].astype(str).tolist()
-P = data["routes"]["route_id"].astype(str).tolist()
-K = data["chargers"]["charger_type"].astype(str).tolist()
-KV2G = data["chargers"].loc[data["chargers"]["is_v2g"] == 1, "charger_type"].astype(str).tolist()
-
-# years: tomar del D_p_t (asegúrate consistencia)
-years = sorted(data["D"]["year"].unique().tolist())
-
-# windows: dict route -> dict(window -> list(nodes))
-windows = defaultdict(lambda: defaultdict(list))
-for _, r in data["windows"].iterrows():
-    windows[str(r["route_id"])][str(r["window_id"])].append(str(r["node_id"]))
-
 # helpers: create lookup dicts (tuplas como claves)
 def df_to_dict(df, keys, value_col):
     return {tuple([str(row[k]) for k in keys]): row[value_col] for _, row in df.iterrows()}
 
-# A_ip
-A = {(str(row["node_id"]), str(row["route_id"])): int(row["A"]) for _, row in data["A"].iterrows()}
+# opts: {"sparse": bool, "horizon": int | None}
+def build_params(data, opts):
+    N = data["nodes"]["node_id"].astype(str).tolist()
+    P = data["routes"]["route_id"].astype(str).tolist()
+    K = data["chargers"]["charger_type"].astype(str).tolist()
+    KV2G = data["chargers"].loc[data["chargers"]["is_v2g"] == 1, "charger_type"].astype(str).tolist()
 
-# D_p_t
-D = {(str(row["route_id"]), int(row["year"])): float(row["D"]) for _, row in data["D"].iterrows()}
+    # years: tomar del D_p_t (asegúrate consistencia)
+    years = sorted(data["D"]["year"].unique().tolist())
+    if opts["horizon"] is not None:
+        years = years[:opts["horizon"]]
 
-# CFIX
-CFIX = {(str(row["node_id"]), int(row["year"])): float(row["CFIX"]) for _, row in data["CFIX"].iterrows()}
+    # windows: dict route -> dict(window -> list(nodes))
+    windows = defaultdict(lambda: defaultdict(list))
+    for _, r in data["windows"].iterrows():
+        windows[str(r["route_id"])][str(r["window_id"])].append(str(r["node_id"]))
 
-# CVAR
-CVAR = {(str(row["node_id"]), str(row["charger_type"]), int(row["year"])): float(row["CVAR"])
-        for _, row in data["CVAR"].iterrows()}
+    # A_ip
+    A = {(str(row["node_id"]), str(row["route_id"])): int(row["A"]) for _, row in data["A"].iterrows()}
 
-# G
-G = {(str(row["node_id"]), int(row["year"])): float(row["G_kW"]) for _, row in data["G"].iterrows()}
+    # pares (i,p) con variable de asignación: todos (denso) o sólo A_ip = 1 (--sparse)
+    if opts["sparse"]:
+        NP = [(i, p) for i in N for p in P if A.get((i, p), 0) > 0]
+    else:
+        NP = [(i, p) for i in N for p in P]
 
-# Umax
-Umax = {str(row["node_id"]): int(row["Umax"]) for _, row in data["Umax"].iterrows()}
+    # D_p_t
+    D = {(str(row["route_id"]), int(row["year"])): float(row["D"]) for _, row in data["D"].iterrows()}
 
-# B
-B = {int(row["year"]): float(row["B"]) for _, row in data["B"].iterrows()}
+    # CFIX
+    CFIX = {(str(row["node_id"]), int(row["year"])): float(row["CFIX"]) for _, row in data["CFIX"].iterrows()}
 
-# INSTMAX
-INSTMAX = {(str(row["node_id"]), int(row["year"])): int(row["INSTMAX"]) for _, row in data["INSTMAX"].iterrows()}
+    # CVAR
+    CVAR = {(str(row["node_id"]), str(row["charger_type"]), int(row["year"])): float(row["CVAR"])
+            for _, row in data["CVAR"].iterrows()}
 
-# MFIX, MVAR
-MFIX = {(str(row["node_id"]), int(row["year"])): float(row["MFIX"]) for _, row in data["MFIX"].iterrows()}
-MVAR = {(str(row["charger_type"]), int(row["year"])): float(row["MVAR"]) for _, row in data["MVAR"].iterrows()}
+    # G
+    G = {(str(row["node_id"]), int(row["year"])): float(row["G_kW"]) for _, row in data["G"].iterrows()}
 
-# PHIeff
-PHIeff = {(str(row["node_id"]), str(row["charger_type"]), int(row["year"])): float(row["PHIeff"])
-          for _, row in data["PHIeff"].iterrows()}
+    # Umax
+    Umax = {str(row["node_id"]): int(row["Umax"]) for _, row in data["Umax"].iterrows()}
 
-# mMIN
-mMIN = {(str(row["node_id"]), int(row["year"])): int(row["mMIN"]) for _, row in data["mMIN"].iterrows()}
+    # B
+    B = {int(row["year"]): float(row["B"]) for _, row in data["B"].iterrows()}
 
-# W_PRIOR
-W_PRIOR = {str(row["route_id"]): float(row["W"]) for _, row in data["Wprior"].iterrows()}
+    # INSTMAX
+    INSTMAX = {(str(row["node_id"]), int(row["year"])): int(row["INSTMAX"]) for _, row in data["INSTMAX"].iterrows()}
 
-# omega
-omega = {int(row["year"]): float(row["omega"]) for _, row in data["omega"].iterrows()}
+    # MFIX, MVAR
+    MFIX = {(str(row["node_id"]), int(row["year"])): float(row["MFIX"]) for _, row in data["MFIX"].iterrows()}
+    MVAR = {(str(row["charger_type"]), int(row["year"])): float(row["MVAR"]) for _, row in data["MVAR"].iterrows()}
 
-# charger attributes
-CAP = {str(row["charger_type"]): float(row["CAP_k"]) for _, row in data["chargers"].iterrows()}
-P_k = {str(row["charger_type"]): float(row["P_k"]) for _, row in data["chargers"].iterrows()}
-L_k = {str(row["charger_type"]): int(row["L_k"]) for _, row in data["chargers"].iterrows()}
+    # PHIeff
+    PHIeff = {(str(row["node_id"]), str(row["charger_type"]), int(row["year"])): float(row["PHIeff"])
+              for _, row in data["PHIeff"].iterrows()}
 
-# -------------------------
-# 3) Crear modelo Gurobi
-# -------------------------
-model = gp.Model("EV_Planning_E3")
+    # mMIN
+    mMIN = {(str(row["node_id"]), int(row["year"])): int(row["mMIN"]) for _, row in data["mMIN"].iterrows()}
+
+    # W_PRIOR
+    W_PRIOR = {str(row["route_id"]): float(row["W"]) for _, row in data["Wprior"].iterrows()}
 
-# Variables
-s = model.addVars(N, years, vtype=GRB.BINARY, name="s")       # estado
-o = model.addVars(N, years, vtype=GRB.BINARY, name="o")       # apertura
-u = model.addVars(N, K, years, vtype=GRB.INTEGER, lb=0, name="u")      # instalacion (anual)
-ubar = model.addVars(N, K, years, vtype=GRB.INTEGER, lb=0, name="ubar")# acumulado (vida util)
-a = model.addVars(N, P, years, vtype=GRB.CONTINUOUS, lb=0, ub=1, name="a")
-z = model.addVars(P, years, vtype=GRB.CONTINUOUS, lb=0, ub=1, name="z")
-v_v2g = model.addVars(N, years, vtype=GRB.CONTINUOUS, lb=0, name="v")  # energia V2G
+    # omega
+    omega = {int(row["year"]): float(row["omega"]) for _, row in data["omega"].iterrows()}
 
-# (opcional) h binary for threshold services (no obligatorio)
-h = model.addVars(N, years, vtype=GRB.BINARY, name="h")
+    # charger attributes
+    CAP = {str(row["charger_type"]): float(row["CAP_k"]) for _, row in data["chargers"].iterrows()}
+    P_k = {str(row["charger_type"]): float(row["P_k"]) for _, row in data["chargers"].iterrows()}
+    L_k = {str(row["charger_type"]): int(row["L_k"]) for _, row in data["chargers"].iterrows()}
+
+    return {"N": N, "P": P, "K": K, "KV2G": KV2G, "years": years, "windows": windows,
+            "A": A, "NP": NP, "D": D, "CFIX": CFIX, "CVAR": CVAR, "G": G, "Umax": Umax,
+            "B": B, "INSTMAX": INSTMAX, "MFIX": MFIX, "MVAR": MVAR, "PHIeff": PHIeff,
+            "mMIN": mMIN, "W_PRIOR": W_PRIOR, "omega": omega, "CAP": CAP, "P_k": P_k,
+            "L_k": L_k}
 
 # -------------------------
-# 4) Restricciones
+# 3) Crear modelo Gurobi
 # -------------------------
-# (1) acumulación con vida útil(sum móvil)
-for i in N:
-    for k in K:
-        L = L_k[k]
+def build_model(data, opts):
+    prm = build_params(data, opts)
+    N, P, K, KV2G, years, windows = (prm[k] for k in ("N", "P", "K", "KV2G", "years", "windows"))
+    A, NP, D, CFIX, CVAR, G, Umax, B = (prm[k] for k in ("A", "NP", "D", "CFIX", "CVAR", "G", "Umax", "B"))
+    INSTMAX, MFIX, MVAR, PHIeff, mMIN = (prm[k] for k in ("INSTMAX", "MFIX", "MVAR", "PHIeff", "mMIN"))
+    W_PRIOR, omega, CAP, P_k, L_k = (prm[k] for k in ("W_PRIOR", "omega", "CAP", "P_k", "L_k"))
+
+    import gurobipy as gp
+    from gurobipy import GRB
+
+    model = gp.Model("EV_Planning_E3")
+
+    # Variables
+    s = model.addVars(N, years, vtype=GRB.BINARY, name="s")       # estado
+    o = model.addVars(N, years, vtype=GRB.BINARY, name="o")       # apertura
+    u = model.addVars(N, K, years, vtype=GRB.INTEGER, lb=0, name="u")      # instalacion (anual)
+    ubar = model.addVars(N, K, years, vtype=GRB.INTEGER, lb=0, name="ubar")# acumulado (vida util)
+    a = model.addVars(NP, years, vtype=GRB.CONTINUOUS, lb=0, ub=1, name="a")
+    z = model.addVars(P, years, vtype=GRB.CONTINUOUS, lb=0, ub=1, name="z")
+    v_v2g = model.addVars(N, years, vtype=GRB.CONTINUOUS, lb=0, name="v")  # energia V2G
+
+    # (opcional) h binary for threshold services (no obligatorio)
+    h = model.addVars(N, years, vtype=GRB.BINARY, name="h")
+
+    # -------------------------
+    # 4) Restricciones
+    # -------------------------
+    # (1) acumulación con vida útil(sum móvil)
+    for i in N:
+        for k in K:
+            L = L_k[k]
+            for t in years:
+                start = max(min(years), t - L + 1)
+                model.addConstr(ubar[i, k, t] == gp.quicksum(u[i, k, tau] for tau in years if start <= tau <= t),
+                                name=f"accu_{i}{k}{t}")
+
+    # (2) apertura <-> estado
+    for i in N:
+        for t in years:
+            model.addConstr(o[i, t] <= s[i, t], name=f"open_le_state_{i}_{t}")
+            if t == min(years):
+                model.addConstr(s[i, t] - 0 <= o[i, t], name=f"open_first_{i}_{t}")
+            else:
+                prev = years[years.index(t) - 1]
+                model.addConstr(s[i, t] - s[i, prev] <= o[i, t], name=f"open_vinc_{i}_{t}")
+
+    # (3) capacidad fisica
+    for i in N:
         for t in years:
-            start = max(min(years), t - L + 1)
-            model.addConstr(ubar[i, k, t] == gp.quicksum(u[i, k, tau] for tau in years if start <= tau <= t),
-                            name=f"accu_{i}{k}{t}")
+            model.addConstr(gp.quicksum(ubar[i, k, t] for k in K) <= Umax.get(i, 10**6), name=f"umax_{i}_{t}")
 
-# (2) apertura <-> estado
-for i in N:
-    for t in years:
-        model.addConstr(o[i, t] <= s[i, t], name=f"open_le_state_{i}_{t}")
-        if t == min(years):
-            model.addConstr(s[i, t] - 0 <= o[i, t], name=f"open_first_{i}_{t}")
-        else:
-            prev = years[years.index(t) - 1]
-            model.addConstr(s[i, t] - s[i, prev] <= o[i, t], name=f"open_vinc_{i}_{t}")
-
-# (3) capacidad fisica
-for i in N:
-    for t in years:
-        model.addConstr(gp.quicksum(ubar[i, k, t] for k in K) <= Umax.get(i, 10**6), name=f"umax_{i}_{t}")
+    # (4) limite potencia
+    for i in N:
+        for t in years:
+            Gval = G.get((i, t), 0.0)
+            model.addConstr(gp.quicksum(P_k[k] * ubar[i, k, t] for k in K) <= Gval * s[i, t],
+                            name=f"powlim_{i}_{t}")
 
-# (4) limite potencia
-for i in N:
-    for t in years:
-        Gval = G.get((i, t), 0.0)
-        model.addConstr(gp.quicksum(P_k[k] * ubar[i, k, t] for k in K) <= Gval * s[i, t],
-                        name=f"powlim_{i}_{t}")
+    # (5) limite instalaciones anuales
+    for i in N:
+        for t in years:
+            instmax = INSTMAX.get((i, t), 10**6)
+            model.addConstr(gp.quicksum(u[i, k, t] for k in K) <= instmax, name=f"instmax_{i}_{t}")
 
-# (5) limite instalaciones anuales
-for i in N:
-    for t in years:
-        instmax = INSTMAX.get((i, t), 10**6)
-        model.addConstr(gp.quicksum(u[i, k, t] for k in K) <= instmax, name=f"instmax_{i}_{t}")
-
-# (6) presupuesto anual
-for t in years:
-    cost_op = gp.quicksum(MFIX.get((i, t), 0.0) * s[i, t] for i in N) + \
-              gp.quicksum(MVAR.get((k, t), 0.0) * ubar[i, k, t] for i in N for k in K)
-    invest = gp.quicksum(CFIX.get((i, t), 0.0) * o[i, t] for i in N) + \
-             gp.quicksum(CVAR.get((i, k, t), 0.0) * u[i, k, t] for i in N for k in K)
-    model.addConstr(invest + cost_op <= B.get(t, 0.0), name=f"budget_{t}")
-
-# (7) elegibilidad y asignacion fraccionada
-for p in P:
-    for t in years:
-        model.addConstr(gp.quicksum(a[i, p, t] for i in N) == z[p, t], name=f"assignsum_{p}_{t}")
-        for i in N:
-            Aip = A.get((i, p), 0)
-            model.addConstr(a[i, p, t] <= Aip * s[i, t], name=f"elig_{i}{p}{t}")
-for i in N:
+    # (6) presupuesto anual
     for t in years:
-        model.addConstr(gp.quicksum(D.get((p, t), 0.0) * a[i, p, t] for p in P) <=
-                        gp.quicksum(CAP[k] * ubar[i, k, t] for k in K), name=f"capacity_assign_{i}_{t}")
+        cost_op = gp.quicksum(MFIX.get((i, t), 0.0) * s[i, t] for i in N) + \
+                  gp.quicksum(MVAR.get((k, t), 0.0) * ubar[i, k, t] for i in N for k in K)
+        invest = gp.quicksum(CFIX.get((i, t), 0.0) * o[i, t] for i in N) + \
+                 gp.quicksum(CVAR.get((i, k, t), 0.0) * u[i, k, t] for i in N for k in K)
+        model.addConstr(invest + cost_op <= B.get(t, 0.0), name=f"budget_{t}")
+
+    # (7) elegibilidad y asignacion fraccionada
+    for p in P:
+        for t in years:
+            model.addConstr(a.sum("*", p, t) == z[p, t], name=f"assignsum_{p}_{t}")
+            for i in N:
+                if (i, p, t) not in a:
+                    continue
+                Aip = A.get((i, p), 0)
+                model.addConstr(a[i, p, t] <= Aip * s[i, t], name=f"elig_{i}{p}{t}")
+    for i in N:
+        for t in years:
+            model.addConstr(gp.quicksum(D.get((p, t), 0.0) * a[i, p, t] for p in P if (i, p, t) in a) <=
+                            gp.quicksum(CAP[k] * ubar[i, k, t] for k in K), name=f"capacity_assign_{i}_{t}")
 
-# (8) ventanas: cobertura final
-Tfinal = max(years)
-for p in P:
-    for w in windows[p].keys():
-        model.addConstr(gp.quicksum(s[i, Tfinal] for i in windows[p][w]) >= 1, name=f"window_final_{p}_{w}")
+    # (8) ventanas: cobertura final
+    Tfinal = max(years)
+    for p in P:
+        for w in windows[p].keys():
+            model.addConstr(gp.quicksum(s[i, Tfinal] for i in windows[p][w]) >= 1, name=f"window_final_{p}_{w}")
 
-# (9) V2G limitado por PHIeff (solo suma sobre KV2G)
-for i in N:
-    for t in years:
-        model.addConstr(v_v2g[i, t] <= gp.quicksum(PHIeff.get((i, k, t), 0.0) * ubar[i, k, t] for k in KV2G),
-                        name=f"v2glimit_{i}_{t}")
+    # (9) V2G limitado por PHIeff (solo suma sobre KV2G)
+    for i in N:
+        for t in years:
+            model.addConstr(v_v2g[i, t] <= gp.quicksum(PHIeff.get((i, k, t), 0.0) * ubar[i, k, t] for k in KV2G),
+                            name=f"v2glimit_{i}_{t}")
 
-# (11) min V2G por estacion (si aplica)
-for i in N:
-    for t in years:
-        model.addConstr(gp.quicksum(ubar[i, k, t] for k in KV2G) >= mMIN.get((i, t), 0) * s[i, t],
-                        name=f"min_v2g_{i}_{t}")
+    # (11) min V2G por estacion (si aplica)
+    for i in N:
+        for t in years:
+            model.addConstr(gp.quicksum(ubar[i, k, t] for k in KV2G) >= mMIN.get((i, t), 0) * s[i, t],
+                            name=f"min_v2g_{i}_{t}")
+
+    # -------------------------
+    # 5) OBJETIVO
+    # -------------------------
+    # cobertura ponderada + beneficio por V2G (omega_t * v)
+    obj_coverage = gp.quicksum(W_PRIOR.get(p, 0.0) * D.get((p, t), 0.0) * z[p, t] for p in P for t in years)
+    obj_v2g = gp.quicksum(omega.get(t, 0.0) * v_v2g[i, t] for i in N for t in years)
+    model.setObjective(obj_coverage + obj_v2g, GRB.MAXIMIZE)
+
+    return model, prm, {"s": s, "o": o, "u": u, "ubar": ubar, "a": a, "z": z, "v": v_v2g}
 
-# -------------------------
-# 5) OBJETIVO
-# -------------------------
-# cobertura ponderada + beneficio por V2G (omega_t * v)
-obj_coverage = gp.quicksum(W_PRIOR.get(p, 0.0) * D.get((p, t), 0.0) * z[p, t] for p in P for t in years)
-obj_v2g = gp.quicksum(omega.get(t, 0.0) * v_v2g[i, t] for i in N for t in years)
-model.setObjective(obj_coverage + obj_v2g, GRB.MAXIMIZE)
 
 # -------------------------
-# 6) PARAMS SOLVER y OPTIMIZAR
+# 6) Construir o retomar, PARAMS SOLVER y OPTIMIZAR
 # -------------------------
-model.Params.TimeLimit = 1800           # 30 minutos exigidos por la pauta
-model.Params.MIPGap = 1e-4
-# model.Params.Threads = 4              # opcional: fijar nº threads
-
-model.optimize()
+def solve(data, args):
+    opts = {"sparse": args.sparse, "horizon": args.horizon}
+    meta_prev = checkpoint.load_meta(args.checkpoint_dir) if args.resume else None
+    if meta_prev and (meta_prev.get("sparse"), meta_prev.get("horizon")) != (args.sparse, args.horizon):
+        print("Checkpoint con otro --sparse/--horizon: se ignora y se parte de cero")
+        meta_prev = None
+    model = checkpoint.load_model(args.checkpoint_dir) if meta_prev else None
+    if model is None:
+        model, prm, var = build_model(data, opts)
+        checkpoint.clear(args.checkpoint_dir)
+        checkpoint.save_model(model, args.checkpoint_dir, var)
+    else:
+        # modelo desde cache: solo recuperar los handles de variables
+        prm = build_params(data, opts)
+        N, P, K, years = prm["N"], prm["P"], prm["K"], prm["years"]
+        ck = args.checkpoint_dir
+        var = {"s": checkpoint.recover_vars(model, ck, "s", N, years),
+               "o": checkpoint.recover_vars(model, ck, "o", N, years),
+               "u": checkpoint.recover_vars(model, ck, "u", N, K, years),
+               "ubar": checkpoint.recover_vars(model, ck, "ubar", N, K, years),
+               "a": checkpoint.recover_vars(model, ck, "a", prm["NP"], years),
+               "z": checkpoint.recover_vars(model, ck, "z", P, years),
+               "v": checkpoint.recover_vars(model, ck, "v", N, years)}
+
+    elapsed_prev = meta_prev["elapsed"] if meta_prev else 0.0
+    if args.resume and checkpoint.seed_incumbent(model, args.checkpoint_dir):
+        print(f"Retomando: {elapsed_prev:.0f}s usados, incumbente cargado como MIP start")
+
+    model.Params.TimeLimit = max(TIME_LIMIT - elapsed_prev, 0.0)
+    model.Params.MIPGap = 1e-4
+    # model.Params.Threads = 4              # opcional: fijar nº threads
+    if args.nodefile_start is not None:
+        model.Params.NodefileStart = args.nodefile_start
+    if args.nodefile_dir is not None:
+        os.makedirs(args.nodefile_dir, exist_ok=True)
+        model.Params.NodefileDir = args.nodefile_dir
+
+    cp = checkpoint.Checkpointer(model, args.checkpoint_dir, interval=args.checkpoint_interval,
+                                 elapsed_prev=elapsed_prev,
+                                 metadata={"model": model.ModelName, "data_dir": DATA_DIR,
+                                           "time_limit": TIME_LIMIT,
+                                           "sparse": args.sparse, "horizon": args.horizon,
+                                           "num_vars": model.NumVars, "num_constrs": model.NumConstrs})
+    model.optimize(cp)
+    cp.finish(model)
+    return model, prm, var
 
 # -------------------------
 # 7) Guardar resultados legibles
 # -------------------------
-import os
-os.makedirs(OUT_DIR, exist_ok=True)
 
 def save_var_table(var, keys, name, cast=int):
+    import pandas as pd
+    from gurobipy import GRB
+
     rows = []
     for key in keys:
         try:
@@ -277,26 +385,47 @@ def save_var_table(var, keys, name, cast=int):
         df.append({"index": k, "value": (int(v.X) if v.X is not None and (v.VType in (GRB.BINARY, GRB.INTEGER)) else v.X)})
     pd.DataFrame(df).to_csv(OUT_DIR + f"{name}.csv", index=False)
 
-# Simple saving of selected variables
-rows = []
-for i in N:
-    for t in years:
-        rows.append({"node": i, "year": t, "s": int(s[i,t].X), "o": int(o[i,t].X),
-                     "v2g": float(v_v2g[i,t].X)})
-pd.DataFrame(rows).to_csv(OUT_DIR + "stations_solution.csv", index=False)
+def save_results(model, prm, var):
+    import pandas as pd
+    from gurobipy import GRB
 
-rows_u = []
-for i in N:
-    for k in K:
+    N, P, K, years = prm["N"], prm["P"], prm["K"], prm["years"]
+    os.makedirs(OUT_DIR, exist_ok=True)
+
+    # Simple saving of selected variables
+    rows = []
+    for i in N:
         for t in years:
-            rows_u.append({'node': i, 'charger': k, 'year': t, 'ubar': int(ubar[i,k,t].X)})
-pd.DataFrame(rows_u).to_csv(OUT_DIR + "chargers_accumulated.csv", index=False)
+            rows.append({"node": i, "year": t, "s": int(var["s"][i,t].X), "o": int(var["o"][i,t].X),
+                         "v2g": float(var["v"][i,t].X)})
+    pd.DataFrame(rows).to_csv(OUT_DIR + "stations_solution.csv", index=False)
+
+    rows_u = []
+    for i in N:
+        for k in K:
+            for t in years:
+                rows_u.append({'node': i, 'charger': k, 'year': t, 'ubar': int(var["ubar"][i,k,t].X)})
+    pd.DataFrame(rows_u).to_csv(OUT_DIR + "chargers_accumulated.csv", index=False)
+
+    rows_a = []
+    for p in P:
+        for t in years:
+            rows_a.append({'route': p, 'year': t, 'z': float(var["z"][p,t].X)})
+    pd.DataFrame(rows_a).to_csv(OUT_DIR + "route_coverage.csv", index=False)
+
+    print("Finished. Status:", model.Status)
+    print("Objective:", model.ObjVal if model.Status == GRB.OPTIMAL or model.Status == GRB.TIME_LIMIT else None)
+
+
+def main(argv=None):
+    args = parser.parse_args(argv)
+    if args.dry_run or args.mem_budget is not None:
+        estimate(args)
+        if args.dry_run:
+            return
+    model, prm, var = solve(load_data(), args)
+    save_results(model, prm, var)
 
-rows_a = []
-for p in P:
-    for t in years:
-        rows_a.append({'route': p, 'year': t, 'z': float(z[p,t].X)})
-pd.DataFrame(rows_a).to_csv(OUT_DIR + "route_coverage.csv", index=False)
 
-print("Finished. Status:", model.Status)
-print("Objective:", model.ObjVal if model.Status == GRB.OPTIMAL or model.Status == GRB.TIME_LIMIT else None)
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,38 @@
 # ============================================================
 # Modelo de Optimización Infraestructura de Carga EV (Chile)
 # Escala nacional, horizonte 10 años, con V2G + incentivos
+# Importable sin efectos: datos + build_model/solve; se ejecuta con main()
 # ============================================================
 
-from gurobipy import Model, GRB, quicksum
+import argparse
+import os
+import time
 import math
 
+import decomposition
+import reduction
+
+parser = argparse.ArgumentParser(description="Modelo EV Charging Chile V2G (escala nacional)")
+parser.add_argument("--scenarios", type=int, default=0,
+                    help="generar N escenarios Monte Carlo de demanda y salir (no resuelve)")
+parser.add_argument("--scenarios-out", default="SCEN/demanda.npy",
+                    help="archivo .npy memory-mapped de salida (escenarios x rutas x años)")
+parser.add_argument("--export", type=int, nargs="*", default=[],
+                    help="índices de escenarios a exportar en formato D_p_t.csv")
+parser.add_argument("--seed", type=int, default=0)
+parser.add_argument("--scenarios-mem", type=float, default=256,
+                    help="MB para temporales al generar escenarios (tamaño de bloque; no cambia los escenarios)")
+parser.add_argument("--reduce", action="store_true",
+                    help="eliminar nodos sin rutas y agregar equivalentes antes de construir")
+parser.add_argument("--reduce-dominated", action="store_true",
+                    help="con --reduce: eliminar también nodos dominados (puede cambiar el óptimo)")
+parser.add_argument("--compare-reduction", action="store_true",
+                    help="resolver instancia original y reducida e informar speedup y objetivos")
+parser.add_argument("--decompose", action="store_true",
+                    help="resolver por corredores en paralelo coordinando presupuestos")
+parser.add_argument("--workers", type=int, default=None,
+                    help="procesos para --decompose (por defecto: nº de regiones o de CPUs)")
+
 # -----------------------------
 # 0) Parámetros “globales”
 # -----------------------------
@@ -84,6 +111,9 @@ ruta_nodos = {
 }
 A_ip = {(i,p): 1 if i in ruta_nodos[p] else 0 for p in P for i in N}
 
+# Nodos de unión entre corredores (norte / centro / sur / austral), para --decompose
+JUNCTIONS = ["Iquique", "Copiapó", "La Serena", "Talca", "Temuco", "Puerto Montt"]
+
 # Política de separación máxima interurbana (km)
 R_p = {p: 100.0 for p in P}
 
@@ -170,169 +200,297 @@ for p in P:
     for t in T:
         D_pt[p][t] = AADT_p[p] * 365 * penetracion_EV_t[t] * captura_p[p] * CARGA_MEDIA_kWh
 
-# --------------------------------
-# 1) Crear modelo
-# --------------------------------
-m = Model("EV_Charging_Chile_V2G")
-
-# -----------------------------
-# 2) Variables de decisión
-# -----------------------------
-# s[i,t] = 1 si la estación i está abierta/activa en el año t
-s = m.addVars(N, T, vtype=GRB.BINARY, name="s")
-
-# x[i,k,t] = número de cargadores tipo k instalados y operativos en i en t (acumulado)
-x = m.addVars(N, K, T, vtype=GRB.INTEGER, lb=0, name="x")
-
-# v[i,t] = número de cargadores V2G en i en t (acumulado)
-v = m.addVars(N, T, vtype=GRB.INTEGER, lb=0, name="v")
-
-# z[p,t] ∈ [0,1] = fracción de demanda D_pt atendida en la ruta p en el año t
-z = m.addVars(P, T, vtype=GRB.CONTINUOUS, lb=0.0, ub=1.0, name="z")
+# Escenarios Monte Carlo de demanda (--scenarios: sólo generar, no resuelve)
+def generate_scenarios(args):
+    import scenarios   # numpy sólo al generar escenarios
+    out_dir = os.path.dirname(args.scenarios_out)
+    if out_dir:
+        os.makedirs(out_dir, exist_ok=True)
+    D_s = scenarios.generate(args.scenarios_out, args.scenarios,
+                             [AADT_p[p] for p in P], [penetracion_EV_t[t] for t in T],
+                             [captura_p[p] for p in P], CARGA_MEDIA_kWh, seed=args.seed,
+                             mem_budget=args.scenarios_mem * 2**20,
+                             meta={"routes": P, "years": [Tmap[t] for t in T]})
+    print(f"{D_s.shape[0]} escenarios guardados en {args.scenarios_out}")
+    for sid in args.export:
+        csv_path = os.path.join(out_dir, f"D_p_t_s{sid}.csv")
+        scenarios.export_csv(D_s, sid, P, [Tmap[t] for t in T], csv_path)
+        print(f"  escenario {sid} -> {csv_path}")
 
 # --------------------------------
-# 3) Restricciones
+# 1) Crear modelo
 # --------------------------------
+# Los parámetros por nodo se reciben como argumento para poder construir
+# tanto la instancia original como la reducida (ver reduction.py).
+# routes/budget/budget_inc/fixed restringen el modelo a una región (ver decomposition.py):
+# los nodos en `fixed` quedan con s, x fijos y su costo lo paga otra región; `floor` da
+# cotas inferiores de s, x para nodos propios (lo que otra región necesitó de ellos).
+T_last = T[-1]
 
-# 3.0) Monotonías (no se desinstala, no se cierra)
-for i in N:
-    for t in T:
-        if t > 1:
-            m.addConstr(s[i,t] >= s[i,t-1], name=f"monot_s[{i},{t}]")
+def build_model(N, A_ip, U_MAX_i, INST_MAX, G_it, C_FIX_it, M_FIX_it, m_MIN_it, mult=None,
+                routes=None, budget=None, budget_inc=None, fixed=None, floor=None):
+    P_r = P if routes is None else routes
+    budget = B_t if budget is None else budget
+    budget_inc = B_INC_t if budget_inc is None else budget_inc
+    fixed = fixed or {}
+    N_own = [i for i in N if i not in fixed]
+
+    from gurobipy import Model, GRB, quicksum
+
+    m = Model("EV_Charging_Chile_V2G")
+
+    # -----------------------------
+    # 2) Variables de decisión
+    # -----------------------------
+    # s[i,t] = 1 si la estación i está abierta/activa en el año t
+    s = m.addVars(N, T, vtype=GRB.BINARY, name="s")
+    if mult:  # nodos agregados: s[g,t] = nº de sitios abiertos del grupo
+        for (i, t), var in s.items():
+            if mult.get(i, 1) > 1:
+                var.VType = GRB.INTEGER
+                var.UB = mult[i]
+
+    # x[i,k,t] = número de cargadores tipo k instalados y operativos en i en t (acumulado)
+    x = m.addVars(N, K, T, vtype=GRB.INTEGER, lb=0, name="x")
+
+    # v[i,t] = número de cargadores V2G en i en t (acumulado)
+    v = m.addVars(N, T, vtype=GRB.INTEGER, lb=0, name="v")
+
+    # z[p,t] ∈ [0,1] = fracción de demanda D_pt atendida en la ruta p en el año t
+    z = m.addVars(P_r, T, vtype=GRB.CONTINUOUS, lb=0.0, ub=1.0, name="z")
+
+    for i, val in fixed.items():
+        for t in T:
+            s[i,t].LB = s[i,t].UB = val["s"][t]
             for k in K:
-                m.addConstr(x[i,k,t] >= x[i,k,t-1], name=f"monot_x[{i},{k},{t}]")
-
-# 3.1) Capacidad física por estación
-for i in N:
+                x[i,k,t].LB = x[i,k,t].UB = val["x"][(k,t)]
+    for i, val in (floor or {}).items():
+        for t in T:
+            s[i,t].LB = val["s"][t]
+            for k in K:
+                x[i,k,t].LB = val["x"][(k,t)]
+
+    # --------------------------------
+    # 3) Restricciones
+    # --------------------------------
+
+    # 3.0) Monotonías (no se desinstala, no se cierra)
+    for i in N:
+        for t in T:
+            if t > 1:
+                m.addConstr(s[i,t] >= s[i,t-1], name=f"monot_s[{i},{t}]")
+                for k in K:
+                    m.addConstr(x[i,k,t] >= x[i,k,t-1], name=f"monot_x[{i},{k},{t}]")
+
+    # 3.1) Capacidad física por estación
+    for i in N:
+        for t in T:
+            m.addConstr(quicksum(x[i,k,t] for k in K) <= U_MAX_i[i]*s[i,t],
+                        name=f"cap_fisica[{i},{t}]")
+
+    # 3.2) Límite anual de instalación
+    for i in N:
+        for t in T:
+            if t == 1:
+                new_inst = quicksum(x[i,k,t] for k in K)
+            else:
+                new_inst = quicksum(x[i,k,t] - x[i,k,t-1] for k in K)
+            m.addConstr(new_inst <= INST_MAX[(i,t)], name=f"inst_max[{i},{t}]")
+
+    # 3.3) Límite de potencia de empalme por nodo
+    for i in N:
+        for t in T:
+            m.addConstr(quicksum(P_k[k]*x[i,k,t] for k in K) <= G_it[(i,t)],
+                        name=f"empalme[{i},{t}]")
+
+    # 3.4) Vínculo V2G: v = sum_{k∈K_V2G} x
+    for i in N:
+        for t in T:
+            m.addConstr(v[i,t] == quicksum(x[i,k,t] for k in K if k in K_V2G),
+                        name=f"v_link[{i},{t}]")
+
+    # 3.5) Mínimo V2G por estación activa
+    for i in N:
+        for t in T:
+            m.addConstr(v[i,t] >= m_MIN_it[(i,t)] * s[i,t], name=f"min_v2g[{i},{t}]")
+
+    # 3.6) Capacidad para cubrir demanda por ruta (en kWh/año)
+    # sum_{i∈ruta p} sum_k CAP_k * x[i,k,t] >= D_pt[p,t] * z[p,t]
+    for p in P_r:
+        for t in T:
+            lhs = quicksum(A_ip[(i,p)] * quicksum(CAP_k[k]*x[i,k,t] for k in K) for i in N)
+            m.addConstr(lhs >= D_pt[p][t] * z[p,t], name=f"demanda[{p},{t}]")
+
+    # 3.7) Cobertura interurbana ≤100 km al final del horizonte:
+    # Para cada ruta p, exigir al menos ceil(longitud/R_p) estaciones activas en t=T
+    for p in P_r:
+        lhs = quicksum(A_ip[(i,p)] * s[i,T_last] for i in N)
+        m.addConstr(lhs >= stations_min_required[p], name=f"cobertura100km[{p},{T_last}]")
+
+    # 3.8) Presupuesto de inversión + OPEX por año
+    # cost_t = sum_i (C_FIX*s + M_FIX*s) + sum_{i,k}(C_VAR*x + M_VAR*x)
     for t in T:
-        m.addConstr(quicksum(x[i,k,t] for k in K) <= U_MAX_i[i]*s[i,t],
-                    name=f"cap_fisica[{i},{t}]")
-
-# 3.2) Límite anual de instalación
-for i in N:
+        inv_opex_t = (
+            quicksum(C_FIX_it[(i,t)]*s[i,t] + M_FIX_it[(i,t)]*s[i,t] for i in N_own) +
+            quicksum(C_VAR_k[k]*x[i,k,t] + M_VAR_k[k]*x[i,k,t] for i in N_own for k in K)
+        )
+        m.addConstr(inv_opex_t <= budget[t], name=f"budget_inv_opex[{t}]")
+
+    # 3.9) Bolsa de subsidios al usuario V2G por año
+    # payout_t = sigma_t * sum_{i,k∈K_V2G} phi_eff(k,t) * x[i,k,t]
     for t in T:
-        if t == 1:
-            new_inst = quicksum(x[i,k,t] for k in K)
-        else:
-            new_inst = quicksum(x[i,k,t] - x[i,k,t-1] for k in K)
-        m.addConstr(new_inst <= INST_MAX[(i,t)], name=f"inst_max[{i},{t}]")
+        payout_t = quicksum((sigma_t[t] * PHI_EFF_k_t[(k,t)] * x[i,k,t]) for i in N_own for k in K if k in K_V2G)
+        m.addConstr(payout_t <= budget_inc[t], name=f"budget_incentivos[{t}]")
+
+    # --------------------------------
+    # 4) Función Objetivo
+    # --------------------------------
+    # Min: (CAPEX + OPEX + Subsidios) - (Beneficio Social V2G) - (Beneficio social por cubrir demanda)
+    # Par de pesos ajustables para “tirar” la solución:
+    ALPHA_DEMANDA = 25.0  # CLP por kWh de demanda atendida (ajustable)
+
+    total_capex_opex = quicksum(
+        C_FIX_it[(i,t)]*s[i,t] + M_FIX_it[(i,t)]*s[i,t] +
+        quicksum(C_VAR_k[k]*x[i,k,t] + M_VAR_k[k]*x[i,k,t] for k in K)
+        for i in N_own for t in T
+    )
 
-# 3.3) Límite de potencia de empalme por nodo
-for i in N:
-    for t in T:
-        m.addConstr(quicksum(P_k[k]*x[i,k,t] for k in K) <= G_it[(i,t)],
-                    name=f"empalme[{i},{t}]")
+    total_subsidios = quicksum(
+        sigma_t[t] * PHI_EFF_k_t[(k,t)] * x[i,k,t]
+        for i in N_own for k in K if k in K_V2G for t in T
+    )
 
-# 3.4) Vínculo V2G: v = sum_{k∈K_V2G} x
-for i in N:
-    for t in T:
-        m.addConstr(v[i,t] == quicksum(x[i,k,t] for k in K if k in K_V2G),
-                    name=f"v_link[{i},{t}]")
+    beneficio_v2g = quicksum(
+        omega_t[t] * PHI_EFF_k_t[(k,t)] * x[i,k,t]
+        for i in N_own for k in K if k in K_V2G for t in T
+    )
 
-# 3.5) Mínimo V2G por estación activa
-for i in N:
-    for t in T:
-        m.addConstr(v[i,t] >= m_MIN_it[(i,t)] * s[i,t], name=f"min_v2g[{i},{t}]")
+    beneficio_demanda = quicksum(
+        ALPHA_DEMANDA * W_PRIOR_p[p] * D_pt[p][t] * z[p,t]
+        for p in P_r for t in T
+    )
 
-# 3.6) Capacidad para cubrir demanda por ruta (en kWh/año)
-# sum_{i∈ruta p} sum_k CAP_k * x[i,k,t] >= D_pt[p,t] * z[p,t]
-for p in P:
-    for t in T:
-        lhs = quicksum(A_ip[(i,p)] * quicksum(CAP_k[k]*x[i,k,t] for k in K) for i in N)
-        m.addConstr(lhs >= D_pt[p][t] * z[p,t], name=f"demanda[{p},{t}]")
+    # Objetivo: minimizar costo neto
+    m.setObjective(total_capex_opex + total_subsidios - beneficio_v2g - beneficio_demanda, GRB.MINIMIZE)
 
-# 3.7) Cobertura interurbana ≤100 km al final del horizonte:
-# Para cada ruta p, exigir al menos ceil(longitud/R_p) estaciones activas en t=T
-T_last = T[-1]
-for p in P:
-    lhs = quicksum(A_ip[(i,p)] * s[i,T_last] for i in N)
-    m.addConstr(lhs >= stations_min_required[p], name=f"cobertura100km[{p},{T_last}]")
-
-# 3.8) Presupuesto de inversión + OPEX por año
-# cost_t = sum_i (C_FIX*s + M_FIX*s) + sum_{i,k}(C_VAR*x + M_VAR*x)
-for t in T:
-    inv_opex_t = (
-        quicksum(C_FIX_it[(i,t)]*s[i,t] + M_FIX_it[(i,t)]*s[i,t] for i in N) +
-        quicksum(C_VAR_k[k]*x[i,k,t] + M_VAR_k[k]*x[i,k,t] for i in N for k in K)
-    )
-    m.addConstr(inv_opex_t <= B_t[t], name=f"budget_inv_opex[{t}]")
+    # Parámetros del solver (opcional)
+    m.Params.MIPGap = 0.02
+    m.Params.TimeLimit = 120  # segundos
+    return m, s, x, v, z
 
-# 3.9) Bolsa de subsidios al usuario V2G por año
-# payout_t = sigma_t * sum_{i,k∈K_V2G} phi_eff(k,t) * x[i,k,t]
-for t in T:
-    payout_t = quicksum((sigma_t[t] * PHI_EFF_k_t[(k,t)] * x[i,k,t]) for i in N for k in K if k in K_V2G)
-    m.addConstr(payout_t <= B_INC_t[t], name=f"budget_incentivos[{t}]")
 
-# --------------------------------
-# 4) Función Objetivo
-# --------------------------------
-# Min: (CAPEX + OPEX + Subsidios) - (Beneficio Social V2G) - (Beneficio social por cubrir demanda)
-# Par de pesos ajustables para “tirar” la solución:
-ALPHA_DEMANDA = 25.0  # CLP por kWh de demanda atendida (ajustable)
-
-total_capex_opex = quicksum(
-    C_FIX_it[(i,t)]*s[i,t] + M_FIX_it[(i,t)]*s[i,t] +
-    quicksum(C_VAR_k[k]*x[i,k,t] + M_VAR_k[k]*x[i,k,t] for k in K)
-    for i in N for t in T
-)
-
-total_subsidios = quicksum(
-    sigma_t[t] * PHI_EFF_k_t[(k,t)] * x[i,k,t]
-    for i in N for k in K if k in K_V2G for t in T
-)
-
-beneficio_v2g = quicksum(
-    omega_t[t] * PHI_EFF_k_t[(k,t)] * x[i,k,t]
-    for i in N for k in K if k in K_V2G for t in T
-)
-
-beneficio_demanda = quicksum(
-    ALPHA_DEMANDA * W_PRIOR_p[p] * D_pt[p][t] * z[p,t]
-    for p in P for t in T
-)
-
-# Objetivo: minimizar costo neto
-m.setObjective(total_capex_opex + total_subsidios - beneficio_v2g - beneficio_demanda, GRB.MINIMIZE)
-
-# Parámetros del solver (opcional)
-m.Params.MIPGap = 0.02
-m.Params.TimeLimit = 120  # segundos
+def solve(N, A_ip, U_MAX_i, INST_MAX, G_it, C_FIX_it, M_FIX_it, m_MIN_it, mult=None):
+    # construye y resuelve; devuelve modelo, valores y tiempos
+    t0 = time.time()
+    m, s, x, v, z = build_model(N, A_ip, U_MAX_i, INST_MAX, G_it, C_FIX_it, M_FIX_it, m_MIN_it, mult)
+    m.update()
+    t_build = time.time() - t0
+    m.optimize()
+    t_solve = time.time() - t0 - t_build
+    if m.SolCount == 0:
+        return m, None, t_build, t_solve
+    sol = {"obj": m.ObjVal,
+           "s": {key: var.X for key, var in s.items()},
+           "x": {key: var.X for key, var in x.items()},
+           "z": {key: var.X for key, var in z.items()}}
+    return m, sol, t_build, t_solve
 
-# -----------------------------
-# 5) Resolver
-# -----------------------------
-m.optimize()
 
 # -----------------------------
-# 6) Reporte mínimo de salida
+# 5) Reporte mínimo de salida
 # -----------------------------
-def print_solution():
-    if m.SolCount == 0:
+def print_solution(sol):
+    if sol is None:
         print("No hay solución.")
         return
-    print("\n=== Valor Óptimo (CLP) ===")
-    print(round(m.ObjVal))
+    if sol.get("heuristic"):
+        estado = "sin convergencia" if not sol["converged"] else "convergida"
+        print(f"\n=== Valor heurístico por descomposición, {estado} (CLP) ===")
+    else:
+        print("\n=== Valor Óptimo (CLP) ===")
+    print(round(sol["obj"]))
 
     # Estaciones abiertas en t=T
-    abiertos_T = [i for i in N if s[i,T_last].X > 0.5]
+    abiertos_T = [i for i in N if sol["s"][i,T_last] > 0.5]
     print(f"\nEstaciones abiertas a {Tmap[T_last]} ({len(abiertos_T)}):")
     print(", ".join(abiertos_T))
 
     # Cargadores por tipo en t=T
     print("\nCargadores por tipo (t=T):")
     for k in K:
-        total_k = sum(int(round(x[i,k,T_last].X)) for i in N)
+        total_k = sum(int(round(sol["x"][i,k,T_last])) for i in N)
         print(f"  {k:12s}: {total_k}")
 
     # V2G total y kWh V2G/año
-    v2g_total_T = sum(int(round(v[i,T_last].X)) for i in N)
-    kWh_v2g_T = sum(PHI_EFF_k_t[(k,T_last)]*x[i,k,T_last].X for i in N for k in K if k in K_V2G)
+    v2g_total_T = sum(int(round(sol["x"][i,k,T_last])) for i in N for k in K if k in K_V2G)
+    kWh_v2g_T = sum(PHI_EFF_k_t[(k,T_last)]*sol["x"][i,k,T_last] for i in N for k in K if k in K_V2G)
     print(f"\nV2G total (t=T): {v2g_total_T} equipos")
     print(f"kWh V2G/año (t=T): {int(round(kWh_v2g_T))}")
 
     # Cobertura de demanda por ruta
     print("\nFracción de demanda atendida z[p,t] en t=T:")
     for p in P:
-        print(f"  {p:10s}: {z[p,T_last].X:.2%}")
+        print(f"  {p:10s}: {sol['z'][p,T_last]:.2%}")
+
+
+# -----------------------------
+# 6) Resolver (CLI)
+# -----------------------------
+def main(argv=None):
+    args = parser.parse_args(argv)
+    if args.scenarios > 0:
+        generate_scenarios(args)
+        return
+
+    node_params = (N, A_ip, U_MAX_i, INST_MAX, G_it, C_FIX_it, M_FIX_it, m_MIN_it)
+
+    if args.reduce or args.compare_reduction:
+        # un nodo sin rutas sólo conviene si el V2G tiene margen positivo por sí solo
+        v2g_rentable = any((omega_t[t] - sigma_t[t]) * PHI_EFF_k_t[(k,t)] > C_VAR_k[k] + M_VAR_k[k]
+                           for k in K_V2G for t in T)
+        red = reduction.reduce_nodes(N, P, T, A_ip, U_MAX_i, INST_MAX, G_it, C_FIX_it, M_FIX_it,
+                                     m_MIN_it, min_por_ruta=stations_min_required,
+                                     dominance=args.reduce_dominated,
+                                     keep=N if v2g_rentable else ())
+        reduction.report(N, red)
+        red_params = (red["N"], red["A_ip"], red["U_MAX"], red["INST_MAX"], red["G"],
+                      red["C_FIX"], red["M_FIX"], red["m_MIN"])
+
+    if args.decompose:
+        peso_ruta = {(p, t): W_PRIOR_p[p] * D_pt[p][t] for p in P for t in T}
+        sol = decomposition.solve_decomposed(build_model, node_params, P, T, K, B_t, B_INC_t,
+                                             peso_ruta, JUNCTIONS, workers=args.workers)
+    elif args.reduce:
+        m, sol, t_build, t_solve = solve(*red_params, mult=red["mult"])
+        if sol is not None:
+            sol["s"], sol["x"], violaciones = reduction.disaggregate(
+                red, T, K, P_k, sol["s"], sol["x"], U_MAX_i, INST_MAX, G_it)
+            if violaciones:
+                print(f"Desagregación: {len(violaciones)} cargadores exceden límites por sitio")
+    else:
+        m, sol, t_build, t_solve = solve(*node_params)
+
+    if args.compare_reduction and not args.decompose:
+        if args.reduce:
+            m_full, sol_full, tb_full, ts_full = solve(*node_params)
+            m_red, sol_red, tb_red, ts_red = m, sol, t_build, t_solve
+        else:
+            m_red, sol_red, tb_red, ts_red = solve(*red_params, mult=red["mult"])
+            m_full, sol_full, tb_full, ts_full = m, sol, t_build, t_solve
+        print(f"Construcción: {tb_full:.2f}s -> {tb_red:.2f}s (x{tb_full / max(tb_red, 1e-9):.1f})")
+        print(f"Resolución:   {ts_full:.2f}s -> {ts_red:.2f}s (x{ts_full / max(ts_red, 1e-9):.1f})")
+        obj = [f"{x['obj']:,.0f}" if x is not None else f"sin solución (status {mm.Status})"
+               for mm, x in ((m_full, sol_full), (m_red, sol_red))]
+        print(f"Objetivo:     {obj[0]} -> {obj[1]}", end="")
+        if sol_full is not None and sol_red is not None:
+            dif = sol_red["obj"] - sol_full["obj"]
+            print(f" (diferencia {dif:,.0f}; {dif / max(abs(sol_full['obj']), 1e-9):+.2%})")
+        else:
+            print(" (sin solución en ambas instancias no hay objetivos que comparar)"
+                  if sol_full is None and sol_red is None else "")
+
+    print_solution(sol)
+
 
-print_solution()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,156 @@
+# reduction.py
+# Reducción de nodos candidatos antes de construir el modelo (usado por gpt_model.py)
+# 1) Nodos sin rutas (A_ip = 0 en todas) se eliminan: no cubren demanda, sólo cuestan
+#    (salvo los de `keep`, p.ej. si el V2G por sí solo tiene margen positivo).
+#    Opcional (dominance=True, --reduce-dominated): también se elimina j si otro nodo i
+#    cubre (al menos) sus rutas con costos no mayores y capacidades no menores. NO es
+#    exacto: cada nodo aporta su propia capacidad, así que puede cambiar el óptimo.
+# 2) Equivalencia: nodos con la misma columna A_ip y el mismo perfil
+#    (U_MAX, G, C_FIX, M_FIX, INST_MAX, m_MIN) se agregan en un nodo con multiplicidad m
+# El modelo agregado usa s[g,t] entera en [0, m] (nº de sitios abiertos del grupo),
+# G e INST_MAX escalados por m; es una relajación del original. `disaggregate`
+# reparte la solución en sitios concretos y reporta lo que no cabe por sitio.
+
+from collections import defaultdict
+
+
+def _routes(i, P, A_ip):
+    return frozenset(p for p in P if A_ip.get((i, p), 0) > 0)
+
+
+def _profile(i, T, U_MAX, INST_MAX, G, C_FIX, M_FIX, m_MIN):
+    return (U_MAX[i],
+            tuple(G[(i, t)] for t in T), tuple(INST_MAX[(i, t)] for t in T),
+            tuple(C_FIX[(i, t)] for t in T), tuple(M_FIX[(i, t)] for t in T),
+            tuple(m_MIN[(i, t)] for t in T))
+
+
+def _dominates(pi, pj):
+    # pi domina a pj: capacidades >= y costos/mínimos <= en todos los años
+    U_i, G_i, I_i, CF_i, MF_i, mm_i = pi
+    U_j, G_j, I_j, CF_j, MF_j, mm_j = pj
+    return (U_i >= U_j
+            and all(a >= b for a, b in zip(G_i, G_j))
+            and all(a >= b for a, b in zip(I_i, I_j))
+            and all(a <= b for a, b in zip(CF_i, CF_j))
+            and all(a <= b for a, b in zip(MF_i, MF_j))
+            and all(a <= b for a, b in zip(mm_i, mm_j)))
+
+
+def reduce_nodes(N, P, T, A_ip, U_MAX, INST_MAX, G, C_FIX, M_FIX, m_MIN, min_por_ruta=None,
+                 dominance=False, keep=()):
+    """Elimina nodos sin rutas (y dominados si `dominance`) y agrega nodos equivalentes.
+
+    `min_por_ruta[p]` protege la cobertura mínima: no se elimina un nodo dominado si su
+    ruta quedaría con menos candidatos que estaciones exigidas; los nodos de `keep` nunca
+    se eliminan. Devuelve un dict con los nuevos conjuntos/parámetros (mismas claves
+    que el original) y el mapeo de grupos.
+    """
+    min_por_ruta = min_por_ruta or {}
+    rutas = {i: _routes(i, P, A_ip) for i in N}
+    perfil = {i: _profile(i, T, U_MAX, INST_MAX, G, C_FIX, M_FIX, m_MIN) for i in N}
+    n_ruta = {p: sum(1 for i in N if p in rutas[i]) for p in P}
+
+    # (1a) nodos que no cubren ninguna ruta (exacto)
+    keep = set(keep)
+    removed = [i for i in N if not rutas[i] and i not in keep]
+    vivos = [i for i in N if i not in removed]
+
+    # (1b) dominancia estricta (rutas ⊆ y perfil dominado, sin ser idénticos); opcional
+    for j in (list(vivos) if dominance else []):
+        for i in vivos:
+            if i == j or j in keep or not rutas[j] <= rutas[i] or not _dominates(perfil[i], perfil[j]):
+                continue
+            if rutas[j] == rutas[i] and perfil[j] == perfil[i]:
+                continue  # equivalentes: se agregan en (2)
+            if all(n_ruta[p] - 1 >= min_por_ruta.get(p, 0) for p in rutas[j]):
+                removed.append(j)
+                vivos.remove(j)
+                for p in rutas[j]:
+                    n_ruta[p] -= 1
+            break
+
+    # (2) equivalencia: misma columna A_ip + mismo perfil
+    clases = defaultdict(list)
+    for i in vivos:
+        clases[(rutas[i], perfil[i])].append(i)
+
+    groups, mult = {}, {}
+    for members in clases.values():
+        g = members[0] if len(members) == 1 else "+".join(members)
+        groups[g] = members
+        mult[g] = len(members)
+
+    rep = {g: members[0] for g, members in groups.items()}
+    Ng = list(groups)
+    return {
+        "N": Ng,
+        "groups": groups,
+        "mult": mult,
+        "removed": removed,
+        "A_ip": {(g, p): A_ip[(rep[g], p)] for g in Ng for p in P},
+        "U_MAX": {g: U_MAX[rep[g]] for g in Ng},
+        "INST_MAX": {(g, t): INST_MAX[(rep[g], t)] * mult[g] for g in Ng for t in T},
+        "G": {(g, t): G[(rep[g], t)] * mult[g] for g in Ng for t in T},
+        "C_FIX": {(g, t): C_FIX[(rep[g], t)] for g in Ng for t in T},
+        "M_FIX": {(g, t): M_FIX[(rep[g], t)] for g in Ng for t in T},
+        "m_MIN": {(g, t): m_MIN[(rep[g], t)] for g in Ng for t in T},
+    }
+
+
+def report(N, red):
+    merged = sum(len(m) for m in red["groups"].values() if len(m) > 1)
+    print(f"Reducción de nodos: {len(N)} -> {len(red['N'])} "
+          f"({len(red['removed'])} eliminados, "
+          f"{merged} agregados en {sum(1 for m in red['groups'].values() if len(m) > 1)} grupos)")
+    if red["removed"]:
+        print("  eliminados:", ", ".join(red["removed"]))
+    for g, members in red["groups"].items():
+        if len(members) > 1:
+            print(f"  grupo x{len(members)}: {', '.join(members)}")
+
+
+def disaggregate(red, T, K, P_k, s_val, x_val, U_MAX, INST_MAX, G):
+    """Reparte la solución agregada (s[g,t], x[g,k,t]) en sitios concretos.
+
+    Los sitios de cada grupo se abren en orden (monótono en t) y los incrementos
+    anuales de x se asignan al sitio abierto con más holgura de potencia.
+    Devuelve (s, x, violaciones) a nivel de sitio; los nodos eliminados quedan en 0.
+    """
+    s, x, violaciones = {}, {}, []
+    for i in red["removed"]:
+        for t in T:
+            s[(i, t)] = 0
+            for k in K:
+                x[(i, k, t)] = 0
+
+    orden_k = sorted(K, key=lambda k: -P_k[k])
+    for g, members in red["groups"].items():
+        carga = {i: {k: 0 for k in K} for i in members}
+        prev = {k: 0 for k in K}
+        for t in T:
+            n_open = int(round(s_val[(g, t)]))
+            abiertos = members[:n_open]
+            nuevos = {i: 0 for i in members}
+
+            def holgura(i):
+                return G[(i, t)] - sum(P_k[kk] * carga[i][kk] for kk in K)
+
+            for k in orden_k:
+                total = int(round(x_val[(g, k, t)]))
+                for _ in range(total - prev[k]):
+                    cabe = [i for i in abiertos
+                            if sum(carga[i].values()) < U_MAX[i]
+                            and nuevos[i] < INST_MAX[(i, t)]
+                            and holgura(i) >= P_k[k]]
+                    destino = max(cabe or abiertos or members, key=holgura)
+                    if not cabe:
+                        violaciones.append((destino, k, t))
+                    carga[destino][k] += 1
+                    nuevos[destino] += 1
+                prev[k] = total
+            for i in members:
+                s[(i, t)] = 1 if i in abiertos else 0
+                for k in K:
+                    x[(i, k, t)] = carga[i][k]
+    return s, x, violaciones
@@ -0,0 +1,154 @@
+# scenarios.py
+# Generador Monte Carlo vectorizado de trayectorias de demanda D[s,p,t] (kWh/año)
+# - Adopción EV en curva S con punto medio y pendiente inciertos
+# - Crecimiento de AADT correlacionado entre rutas
+# - Captura por ruta y año incierta (Beta con media captura_p, acotada a [0,1])
+# Todas las perturbaciones preservan la media: E[D] = point_demand, así el conjunto
+# se reparte en torno a la trayectoria nominal.
+# Sin estacionalidad: un factor mensual se promedia en la demanda anual (kWh/año) que
+# usa el modelo, y sólo cambiaba el resultado a través del recorte de la captura.
+# Cada escenario usa su propio stream aleatorio (SeedSequence.spawn): el resultado
+# depende de `seed` y no del tamaño de bloque.
+# Se guarda como .npy memory-mapped (escenarios x rutas x años) + metadatos .json
+# Uso desde gpt_model.py: python IA/gpt_model.py --scenarios 20000 --scenarios-out SCEN/demanda.npy
+
+import csv
+import json
+import numpy as np
+
+# temporales float64 de forma (n, P, T) vivos a la vez al generar un bloque
+TEMP_BLOQUE = 6
+
+
+def point_demand(AADT, penetracion, captura, carga_kWh):
+    # D[p,t] = AADT_p * 365 * pen_t * captura_p * carga (fórmula estándar, vectorizada)
+    AADT, captura = np.asarray(AADT, dtype=float), np.asarray(captura, dtype=float)
+    return (AADT * captura)[:, None] * 365 * np.asarray(penetracion, dtype=float)[None, :] * carga_kWh
+
+
+def _logistic(t, mid, slope):
+    return 1.0 / (1.0 + np.exp(-slope * (t - mid)))
+
+
+def _mean_curve(t, mid0, slope0, mid_sd, slope_cv, n_nodos=64):
+    # E[logistic] con mid ~ N(mid0, mid_sd²) y pendiente lognormal (cuadratura Gauss-Hermite)
+    x, w = np.polynomial.hermite_e.hermegauss(n_nodos)
+    w = w / w.sum()
+    mid = mid0 + mid_sd * x
+    slope = slope0 * np.exp(slope_cv * x - slope_cv**2 / 2)
+    curvas = _logistic(t[None, None, :], mid[:, None, None], slope[None, :, None])
+    return np.einsum("i,j,ijt->t", w, w, curvas)
+
+
+def fit_s_curve(penetracion, saturacion=0.5):
+    # ajusta punto medio y pendiente de la curva S nominal por mínimos cuadrados en logit
+    pen = np.asarray(penetracion, dtype=float)
+    fuera = np.flatnonzero(~((pen > 0) & (pen < saturacion)))
+    if fuera.size:
+        raise ValueError(f"La penetración debe estar en (0, saturacion={saturacion}) para ajustar "
+                         f"la curva S; fuera de rango en t={(fuera + 1).tolist()}: {pen[fuera].tolist()}")
+    if len(pen) < 2:
+        raise ValueError("Se necesitan al menos 2 años de penetración para ajustar la curva S")
+    t = np.arange(1, len(pen) + 1, dtype=float)
+    slope, intercept = np.polyfit(t, np.log(pen / (saturacion - pen)), 1)
+    return -intercept / slope, slope
+
+
+def generate(path, n_scenarios, AADT, penetracion, captura, carga_kWh,
+             mid_sd=1.0, slope_cv=0.15, saturacion=0.5,
+             growth_mu=0.0, growth_sd=0.03, growth_rho=0.6,
+             capture_sd=0.10, seed=0, mem_budget=256 * 2**20, dtype=np.float32, meta=None):
+    """Genera `n_scenarios` trayectorias y las escribe en `path` (.npy memory-mapped).
+
+    Cada escenario perturba los valores puntuales: con parámetros nominales y sin
+    ruido se recupera exactamente `point_demand`. `capture_sd` es el coeficiente de
+    variación de la captura. Los escenarios se generan por bloques cuyo tamaño sale de
+    `mem_budget` (bytes de temporales). Devuelve el memmap en lectura.
+    """
+    AADT = np.asarray(AADT, dtype=float)
+    pen0 = np.asarray(penetracion, dtype=float)
+    cap0 = np.asarray(captura, dtype=float)
+    nP, nT = len(AADT), len(pen0)
+    t = np.arange(1, nT + 1, dtype=float)
+    chunk = max(1, int(mem_budget // (TEMP_BLOQUE * nP * nT * 8)))
+    streams = np.random.SeedSequence(seed).spawn(n_scenarios)
+
+    # captura ~ Beta(a, b) con media cap0 y desviación capture_sd * cap0
+    var = (capture_sd * cap0) ** 2
+    if np.any(var >= cap0 * (1 - cap0)):
+        raise ValueError(f"capture_sd={capture_sd} es demasiado grande para capturas {cap0.tolist()} "
+                         "(la varianza debe ser menor que captura * (1 - captura))")
+    if capture_sd > 0:
+        nu = (cap0 * (1 - cap0) / var - 1)[:, None]
+        a_beta = np.repeat(cap0[:, None] * nu, nT, axis=1)                  # (P, T)
+        b_beta = np.repeat((1 - cap0[:, None]) * nu, nT, axis=1)
+
+    # curva S nominal: los escenarios escalan pen0 por curva / E[curva], así E[pen] = pen0
+    # (un shock del punto medio no es simétrico en la curva: sin esto la media sube
+    # ~30% en los primeros años)
+    mid0, slope0 = fit_s_curve(pen0, saturacion)
+    curve0 = _mean_curve(t, mid0, slope0, mid_sd, slope_cv)
+
+    # crecimiento AADT: shocks equicorrelacionados entre rutas (Cholesky)
+    corr = np.full((nP, nP), growth_rho) + (1 - growth_rho) * np.eye(nP)
+    chol = np.linalg.cholesky(corr) * growth_sd
+
+    out = np.lib.format.open_memmap(path, mode="w+", dtype=dtype, shape=(n_scenarios, nP, nT))
+    for s0 in range(0, n_scenarios, chunk):
+        n = min(chunk, n_scenarios - s0)
+
+        # sorteos por escenario, cada uno con su stream
+        z_adop = np.empty((n, 2))
+        z_aadt = np.empty((n, nT, nP))
+        cap = np.broadcast_to(cap0[None, :, None], (n, nP, nT)).copy()
+        for j in range(n):
+            rng = np.random.default_rng(streams[s0 + j])
+            z_adop[j] = rng.standard_normal(2)
+            z_aadt[j] = rng.standard_normal((nT, nP))
+            if capture_sd > 0:
+                cap[j] = rng.beta(a_beta, b_beta)
+
+        # (1) adopción: punto medio normal, pendiente lognormal
+        mid = mid0 + mid_sd * z_adop[:, :1]
+        slope = slope0 * np.exp(slope_cv * z_adop[:, 1:] - slope_cv**2 / 2)
+        pen = pen0 * _logistic(t, mid, slope) / curve0                          # (n, T)
+
+        # (2) AADT: log-crecimiento acumulado desde t=1 (t=1 = valor base);
+        #     -sd²/2 para que growth_mu sea el crecimiento medio (E[factor] = e^{mu·t})
+        g = growth_mu - growth_sd**2 / 2 + z_aadt @ chol.T                     # (n, T, P)
+        g[:, 0, :] = 0.0
+        aadt = AADT[:, None] * np.exp(np.cumsum(g, axis=1)).transpose(0, 2, 1)  # (n, P, T)
+
+        # (3) captura: sorteada arriba (n, P, T)
+        out[s0:s0 + n] = aadt * 365 * pen[:, None, :] * cap * carga_kWh
+    out.flush()
+    del out
+
+    params = dict(n_scenarios=n_scenarios, mid0=mid0, slope0=slope0, mid_sd=mid_sd,
+                  slope_cv=slope_cv, saturacion=saturacion, growth_mu=growth_mu,
+                  growth_sd=growth_sd, growth_rho=growth_rho, capture_sd=capture_sd, seed=seed)
+    params.update(meta or {})
+    with open(path + ".json", "w", encoding="utf-8") as f:
+        json.dump(params, f, indent=2, ensure_ascii=False)
+    return load(path)
+
+
+def load(path):
+    # memmap de sólo lectura: los barridos leen sólo los escenarios que cortan
+    return np.load(path, mmap_mode="r")
+
+
+def load_meta(path):
+    with open(path + ".json", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def export_csv(D, scenario, routes, years, path):
+    # escenario -> formato D_p_t.csv (route_id, year, D)
+    Ds = np.asarray(D[scenario], dtype=float)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["route_id", "year", "D"])
+        for j, p in enumerate(routes):
+            for k, y in enumerate(years):
+                w.writerow([p, y, Ds[j, k]])
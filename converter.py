@@ -35,4 +35,29 @@ m_MIN = {}
 Omega = {}
 Sigma = {}
 B_INC = {}
-Phi_eff = {}
\ No newline at end of file
+Phi_eff = {}
+
+
+class Data:
+    """Conjuntos y parámetros del modelo (mismos nombres que arriba)."""
+
+    def __init__(self, **values):
+        for name, default in _defaults().items():
+            setattr(self, name, values.pop(name, default))
+        if values:
+            raise TypeError(f"Parámetros desconocidos: {', '.join(values)}")
+
+
+def _defaults():
+    # copia de los valores del módulo: cada Data es independiente
+    names = ["N", "P", "P_Crit", "K", "W", "T", "period", "K_V2G",
+             "D", "A", "R", "C_FIX", "C_VAR", "CAP", "Pot", "G", "Phi", "U_MAX", "B",
+             "INST_MAX", "L", "M_FIX", "M_VAR", "W_PRIOR", "Z_MIN", "Phi_BASE", "Phi_MAX",
+             "Theta", "Beta", "m_MIN", "Omega", "Sigma", "B_INC", "Phi_eff"]
+    g = globals()
+    return {n: (g[n].copy() if hasattr(g[n], "copy") else g[n]) for n in names}
+
+
+def load():
+    # datos actuales del módulo (se completan al parsear)
+    return Data()
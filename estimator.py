@@ -0,0 +1,222 @@
+# estimator.py
+# Estimación de tamaño del modelo ANTES de construirlo (dry-run)
+# Cuenta variables, filas y nonzeros por familia para model.py e IA/gemini_model.py
+# - gemini: lee sólo tamaños de conjuntos y esparsidad desde los CSV de DATA/
+# - model:  usa los conjuntos de converter.load() (los mismos que construye main.py)
+# Ejecutar: python estimator.py --model gemini --mem-budget 8
+
+import argparse
+import csv
+import os
+import sys
+from collections import defaultdict
+
+DATA_DIR = "DATA/"
+
+# Heurísticas de memoria (bytes): objeto Python + estructura interna de Gurobi.
+# Los nonzeros se guardan por fila y por columna, más la LinExpr temporal al construir.
+BYTES_PER_VAR = 250
+BYTES_PER_ROW = 250
+BYTES_PER_NZ  = 48
+PANDAS_FACTOR = 6   # DataFrames en memoria vs tamaño de los CSV en disco
+
+
+def _rows(data_dir, fname):
+    with open(os.path.join(data_dir, fname), newline="", encoding="utf-8") as f:
+        yield from csv.DictReader(f)
+
+
+# -------------------------
+# 1) Tamaños desde los CSV
+# -------------------------
+def read_sizes(data_dir=DATA_DIR):
+    try:
+        nodes = [str(r["node_id"]) for r in _rows(data_dir, "nodes.csv")]
+        routes = [str(r["route_id"]) for r in _rows(data_dir, "routes.csv")]
+        chargers = list(_rows(data_dir, "chargers.csv"))
+        years = sorted({int(r["year"]) for r in _rows(data_dir, "D_p_t.csv")})
+        windows = defaultdict(int)
+        for r in _rows(data_dir, "windows.csv"):
+            windows[(str(r["route_id"]), str(r["window_id"]))] += 1
+        E_i, E_p = defaultdict(int), defaultdict(int)
+        for r in _rows(data_dir, "A_ip.csv"):
+            if int(r["A"]) > 0:
+                E_i[str(r["node_id"])] += 1
+                E_p[str(r["route_id"])] += 1
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"Falta archivo para estimar tamaño - {e}")
+
+    csv_bytes = sum(os.path.getsize(os.path.join(data_dir, f))
+                    for f in os.listdir(data_dir) if f.endswith(".csv"))
+    return {
+        "N": len(nodes), "P": len(routes), "K": len(chargers),
+        "KV2G": sum(1 for r in chargers if int(r["is_v2g"]) == 1),
+        "L_k": [int(r["L_k"]) for r in chargers],
+        "years": years,
+        "windows": len(windows), "window_nodes": sum(windows.values()),
+        "E": sum(E_i.values()),   # pares elegibles A_ip = 1
+        "csv_bytes": csv_bytes,
+    }
+
+
+def sizes_from_data(data):
+    # tamaños desde un converter.Data (lo que model.build construye realmente)
+    N, P = data.N, data.P
+    windows = [w for p in P for w in data.W[p]]
+    return {
+        "N": len(N), "P": len(P), "K": len(data.K),
+        "KV2G": len(data.K_V2G),
+        "L_k": [data.L.get(k, 0) for k in data.K],
+        "years": list(range(data.period)),
+        "n_T": len(data.T),   # R2.2.1 recorre range(1, len(T))
+        "windows": len(windows), "window_nodes": sum(len(N[w]) for w in windows),
+        "E": sum(1 for i in N for p in P if data.A.get((i, p), 0) > 0),
+        "csv_bytes": 0,
+    }
+
+
+# -------------------------
+# 2) Conteo por familia
+# -------------------------
+# Cada familia: (nombre, n_variables, n_filas, n_nonzeros)
+# Variables y filas son exactas. Los nonzeros son exactos para la estructura de A_ip
+# (a <= A_ip*s sólo lleva s si A_ip = 1) y una cota superior para el resto: Gurobi
+# descarta coeficientes cero (costos, D, G, PHIeff nulos) y aquí no se leen esos valores.
+def _accumulation_nnz(L_k, T):
+    # fila ubar[i,k,t] == sum_{tau en ventana de vida útil} u[i,k,tau]
+    return sum(1 + min(L, t + 1) for L in L_k for t in range(T))
+
+
+def estimate_gemini(sz, sparse=False, horizon=None):
+    N, P, K, KV = sz["N"], sz["P"], sz["K"], sz["KV2G"]
+    T = len(sz["years"]) if horizon is None else min(horizon, len(sz["years"]))
+    NA = sz["E"] if sparse else N * P   # pares (i,p) con variable a
+    return [
+        ("s", N * T, 0, 0),
+        ("o", N * T, 0, 0),
+        ("u", N * K * T, 0, 0),
+        ("ubar", N * K * T, 0, 0),
+        ("a", NA * T, 0, 0),
+        ("z", P * T, 0, 0),
+        ("v", N * T, 0, 0),
+        ("h", N * T, 0, 0),
+        ("accu", 0, N * K * T, N * _accumulation_nnz(sz["L_k"], T)),
+        ("open_le_state", 0, N * T, 2 * N * T),
+        ("open_vinc", 0, N * T, N * (2 + 3 * (T - 1)) if T else 0),
+        ("umax", 0, N * T, N * T * K),
+        ("powlim", 0, N * T, N * T * (K + 1)),
+        ("instmax", 0, N * T, N * T * K),
+        ("budget", 0, T, T * (2 * N + 2 * N * K)),
+        ("assignsum", 0, P * T, T * (NA + P)),
+        ("elig", 0, NA * T, NA * T + sz["E"] * T),
+        ("capacity_assign", 0, N * T, T * (NA + N * K)),
+        ("window_final", 0, sz["windows"], sz["window_nodes"]),
+        ("v2glimit", 0, N * T, N * T * (1 + KV)),
+        ("min_v2g", 0, N * T, N * T * (1 + KV)),
+    ]
+
+
+def estimate_model(sz):
+    # model.py: mismo esquema con y[i,p,t] binaria y a densa; R6/R12 por año
+    N, P, K, KV = sz["N"], sz["P"], sz["K"], sz["KV2G"]
+    T = len(sz["years"])
+    T2 = max(sz.get("n_T", T) - 1, 0)
+    return [
+        ("s", N * T, 0, 0),
+        ("u", N * K * T, 0, 0),
+        ("u_", N * K * T, 0, 0),
+        ("y", N * P * T, 0, 0),
+        ("a", N * P * T, 0, 0),
+        ("v", N * T, 0, 0),
+        ("z", P * T, 0, 0),
+        ("o", N * T, 0, 0),
+        ("R1", 0, N * K * T, N * _accumulation_nnz(sz["L_k"], T)),
+        ("R2.1", 0, N * T, 2 * N * T),
+        ("R2.2.1", 0, N * T2, 3 * N * T2),
+        ("R2.2.2", 0, N, N),
+        ("R3", 0, N * T, N * T * K),
+        ("R4", 0, N * T, N * T * (K + 1)),
+        ("R5", 0, N * T, N * T * K),
+        ("R6", 0, T, T * (2 * N + N * K)),
+        ("R7.1", 0, N * P * T, N * P * T + sz["E"] * T),
+        ("R7.2", 0, P * T, T * (N * P + P)),
+        ("R7.3", 0, N * T, T * (N * P + N * K)),
+        ("R8", 0, sz["windows"], sz["window_nodes"]),
+        ("R9", 0, N * T, N * T * (1 + KV)),
+        ("R11", 0, N * T, N * T * (1 + KV)),
+        ("R12", 0, T, T * N),
+    ]
+
+
+def totals(families):
+    return tuple(sum(f[j] for f in families) for j in (1, 2, 3))
+
+
+def peak_memory(sz, families):
+    nvars, nrows, nnz = totals(families)
+    return (nvars * BYTES_PER_VAR + nrows * BYTES_PER_ROW + nnz * BYTES_PER_NZ
+            + sz["csv_bytes"] * PANDAS_FACTOR)
+
+
+# -------------------------
+# 3) Reporte y control de presupuesto
+# -------------------------
+def report(sz, families, title=""):
+    print(f"=== Estimación {title} (N={sz['N']}, P={sz['P']}, K={sz['K']}, "
+          f"T={len(sz['years'])}, A_ip elegibles={sz['E']}) ===")
+    print(f"{'familia':18s} {'variables':>14s} {'filas':>14s} {'nonzeros':>16s}")
+    for name, nv, nr, nz in families:
+        print(f"{name:18s} {nv:14,d} {nr:14,d} {nz:16,d}")
+    nvars, nrows, nnz = totals(families)
+    print(f"{'TOTAL':18s} {nvars:14,d} {nrows:14,d} {nnz:16,d}")
+    print(f"Memoria peak estimada: {peak_memory(sz, families) / 1e9:.2f} GB")
+
+
+def suggest_gemini(sz, budget):
+    # modos de IA/gemini_model.py que caben en el presupuesto (bytes)
+    if peak_memory(sz, estimate_gemini(sz, sparse=True)) <= budget:
+        return ["--sparse"]
+    for H in range(len(sz["years"]) - 1, 0, -1):
+        if peak_memory(sz, estimate_gemini(sz, sparse=True, horizon=H)) <= budget:
+            return [f"--sparse --horizon {H}"]
+    return []
+
+
+def check_budget(sz, families, budget_gb, suggestions=None):
+    """Termina el proceso si la memoria estimada excede `budget_gb`.
+
+    `suggestions=None` indica que el modelo no tiene modos reducidos."""
+    need = peak_memory(sz, families)
+    if budget_gb is None or need <= budget_gb * 1e9:
+        return
+    print(f"Memoria estimada {need / 1e9:.2f} GB excede el presupuesto de {budget_gb:.2f} GB; "
+          "no se construye el modelo.")
+    if suggestions is None:
+        print("Este modelo no tiene modos reducidos.")
+    elif suggestions:
+        print("Modos que caben:", ", ".join(suggestions))
+    else:
+        print("Ningún modo reducido cabe en el presupuesto.")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Dry-run: tamaño y memoria del modelo")
+    parser.add_argument("--data-dir", default=DATA_DIR, help="(gemini) directorio de los CSV")
+    parser.add_argument("--model", choices=["model", "gemini"], default="gemini")
+    parser.add_argument("--sparse", action="store_true", help="(gemini) a sólo en pares A_ip = 1")
+    parser.add_argument("--horizon", type=int, default=None, help="(gemini) primeros H años")
+    parser.add_argument("--mem-budget", type=float, default=None, help="presupuesto de memoria (GB)")
+    args = parser.parse_args()
+
+    if args.model == "gemini":
+        sz = read_sizes(args.data_dir)
+        fam = estimate_gemini(sz, args.sparse, args.horizon)
+        sug = suggest_gemini(sz, args.mem_budget * 1e9) if args.mem_budget else []
+    else:
+        import converter
+        sz = sizes_from_data(converter.load())
+        fam = estimate_model(sz)
+        sug = None
+    report(sz, fam, args.model)
+    check_budget(sz, fam, args.mem_budget, sug)
@@ -1,6 +1,42 @@
-from gurobipy import GRB, Model, quicksum
-from model import model
+import argparse
 
-if model.Status == GRB.OPTIMAL:
-    print(f"Cobertura de demanda todal óptima: {model.ObjVal}\n")
+parser = argparse.ArgumentParser(description="Modelo EV Charging Chile V2G")
+parser.add_argument("--dry-run", action="store_true",
+                    help="sólo estimar variables, filas, nonzeros y memoria (no construye)")
+parser.add_argument("--mem-budget", type=float, default=None,
+                    help="GB máximos estimados; si se exceden no se construye el modelo")
+parser.add_argument("--time-limit", type=float, default=None, help="TimeLimit de Gurobi (s)")
+parser.add_argument("--mip-gap", type=float, default=None, help="MIPGap de Gurobi")
+parser.add_argument("--threads", type=int, default=None, help="Threads de Gurobi")
 
+
+def main(argv=None):
+    args = parser.parse_args(argv)
+
+    import converter
+    data = converter.load()
+
+    # estimar antes de construir (mismos conjuntos que se construyen)
+    if args.dry_run or args.mem_budget is not None:
+        import estimator
+        sizes = estimator.sizes_from_data(data)
+        families = estimator.estimate_model(sizes)
+        estimator.report(sizes, families, "model")
+        estimator.check_budget(sizes, families, args.mem_budget)
+        if args.dry_run:
+            return
+
+    import model
+
+    params = {"TimeLimit": args.time_limit, "MIPGap": args.mip_gap, "Threads": args.threads}
+    handle = model.build(data)
+    model.solve(handle, {k: v for k, v in params.items() if v is not None})
+
+    from gurobipy import GRB
+    result = model.extract(handle)
+    if result is not None and result["status"] == GRB.OPTIMAL:
+        print(f"Cobertura de demanda todal óptima: {result['obj']}\n")
+
+
+if __name__ == "__main__":
+    main()